@@ -2,12 +2,18 @@
 Structured logging configuration for the API
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 import structlog
 from structlog.stdlib import LoggerFactory
 
+# Background listener that writes queued log records (see configure_logging)
+_queue_listener: Optional[QueueListener] = None
+
 
 def configure_logging() -> None:
     """Configure structured logging for the application"""
@@ -37,6 +43,23 @@ def configure_logging() -> None:
         stream=sys.stdout,
         level=logging.INFO,
     )
+    
+    # Route root handlers through a queue so formatting and stdout writes
+    # happen on a listener thread instead of the request path
+    global _queue_listener
+    if _queue_listener is None:
+        root = logging.getLogger()
+        handlers = root.handlers[:]
+        for handler in handlers:
+            root.removeHandler(handler)
+        log_queue = queue.SimpleQueue()
+        root.addHandler(QueueHandler(log_queue))
+        _queue_listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+        # Flush anything still queued when the process exits
+        atexit.register(_queue_listener.stop)
 
 
 def get_logger(name: str) -> structlog.BoundLogger:
@@ -88,9 +111,13 @@ class DatabaseLogger:
     
     def __init__(self):
         self.logger = get_logger("api.database")
+        self._stdlib_logger = logging.getLogger("api.database")
     
     def log_operation(self, operation: str, collection: str, **kwargs) -> None:
         """Log database operation"""
+        # Skip the structlog processor chain when INFO is filtered out
+        if not self._stdlib_logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
             "Database operation",
             operation=operation,
@@ -114,9 +141,17 @@ class BusinessLogger:
     
     def __init__(self):
         self.logger = get_logger("api.business")
+        self._stdlib_logger = logging.getLogger("api.business")
+    
+    def is_enabled(self) -> bool:
+        """Whether business operations are logged at the current level"""
+        return self._stdlib_logger.isEnabledFor(logging.INFO)
     
     def log_operation(self, service: str, operation: str, **kwargs) -> None:
         """Log business operation"""
+        # Skip the structlog processor chain when INFO is filtered out
+        if not self.is_enabled():
+            return
         self.logger.info(
             "Business operation",
             service=service,
@@ -239,7 +239,9 @@ class StreamAnalyticsDateRange(BaseModel):
 class StreamAnalyticsResponse(BaseModel):
     """Response model for stream analytics endpoint"""
     dataPoints: List[StreamAnalyticsDataPoint] = Field(
-        ..., description="Individual stream data points"
+        ...,
+        description="Individual stream data points (empty when "
+        "includeDataPoints is false)"
     )
     groups: List[StreamAnalyticsGroup] = Field(
         ...,
@@ -247,7 +249,9 @@ class StreamAnalyticsResponse(BaseModel):
         "clientReference, and promptIds"
     )
     totalCount: int = Field(
-        ..., description="Total number of data points returned"
+        ...,
+        description="Total number of completed streams matched, "
+        "whether or not their data points are returned"
     )
     dateRange: StreamAnalyticsDateRange = Field(
         ..., description="Applied date range filters"
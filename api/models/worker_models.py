@@ -35,6 +35,15 @@ class WorkerConfig(BaseModel):
         None,
         description="Optional filters for clientReference fields (exact match)"
     )
+    maxPollInterval: Optional[int] = Field(
+        None,
+        description=(
+            "Upper bound in seconds for polling backoff while the queue is "
+            "empty (defaults to 10x pollInterval, at most 3600)"
+        ),
+        ge=1,
+        le=3600
+    )
 
 
 class WorkerCreateRequest(BaseModel):
@@ -256,15 +256,21 @@ async def get_stream_analytics(
     date_to: Optional[str] = Query(
         None, alias="to",
         description="ISO datetime upper bound on createdAt"
+    ),
+    include_data_points: bool = Query(
+        True, alias="includeDataPoints",
+        description="Return per-stream data points (false returns "
+        "only groups)"
     )
 ):
     """
     Get per-stream processing metrics for charting.
 
     - Requires client authentication or admin API key
-    - Returns individual data points (one per completed
-      stream) with tokens, costs, and duration
     - Groups data by model, clientReference, and promptIds
+    - Returns individual data points (one per completed stream)
+      with tokens, costs, and duration; set includeDataPoints=false
+      to return only the groups
     - Supports date range filtering via from / to
     - Only completed streams are included
     - Admin can see all streams
@@ -294,7 +300,8 @@ async def get_stream_analytics(
             client_id=client_id,
             date_from=date_from,
             date_to=date_to,
-            is_admin=is_admin
+            is_admin=is_admin,
+            include_data_points=include_data_points
         )
         return StreamAnalyticsResponse(
             dataPoints=result["dataPoints"],
@@ -601,7 +608,8 @@ async def stream_completion(
                         stream_id=stream_id,
                         response_data=response_data,
                         processing_metrics=processing_metrics,
-                        status="completed"
+                        status="completed",
+                        client_id=effective_client_id
                     )
                 except Exception as exc:
                     logger.error(
@@ -651,7 +659,8 @@ async def stream_completion(
                         stream_id=stream_id,
                         response_data={"error": str(e)},
                         processing_metrics=err_metrics,
-                        status="error"
+                        status="error",
+                        client_id=effective_client_id
                     )
                 except Exception as exc:
                     logger.error(
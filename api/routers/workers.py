@@ -291,7 +291,7 @@ async def update_workers_batch(
                         })
                         continue
 
-                    success = manager.start_worker(worker_id)
+                    success = manager.start_worker(worker_id, worker=worker)
                     if not success:
                         failed.append({
                             "workerId": worker_id,
@@ -591,7 +591,7 @@ async def start_worker(
         
         # Start the worker
         try:
-            success = manager.start_worker(worker_id)
+            success = manager.start_worker(worker_id, worker=worker)
             if not success:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -748,6 +748,7 @@ async def delete_worker(
         service.delete_worker(
             worker_id, client_id=client_id, is_admin=is_admin
         )
+        manager.forget_worker(worker_id)
         
         return None
     except HTTPException:
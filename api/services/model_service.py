@@ -14,6 +14,7 @@ from utilities.cosmos_connector import (
     db_delete
 )
 from api.core.logging import get_logger, BusinessLogger
+from api.services.stream_service import StreamService
 
 logger = get_logger("api.services.model_service")
 business_logger = BusinessLogger()
@@ -278,6 +279,9 @@ class ModelService:
         )
         
         if success:
+            StreamService.invalidate_model_cache(model.get("name"))
+            if update_doc.get("name"):
+                StreamService.invalidate_model_cache(update_doc["name"])
             logger.info("Model updated successfully", model_id=model_id, updates=update_doc)
         else:
             logger.error("Failed to update model", model_id=model_id)
@@ -322,6 +326,7 @@ class ModelService:
         )
         
         if success:
+            StreamService.invalidate_model_cache(model.get("name"))
             logger.info("Model deleted successfully", model_id=model_id)
         else:
             logger.error("Failed to delete model", model_id=model_id)
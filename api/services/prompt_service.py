@@ -15,6 +15,7 @@ from utilities.cosmos_connector import (
     db_delete,
     get_document_by_id
 )
+from utilities.prompt_cache import invalidate_prompt
 from api.core.logging import get_logger, BusinessLogger
 from api.models.prompt_models import PromptStatus
 from api.services.client_service import get_client_service
@@ -456,6 +457,9 @@ class PromptService:
             business_logger.log_error("prompt_service", "update_prompt", "Failed to update prompt in database")
             raise RuntimeError("Failed to update prompt in database")
         
+        # Running workers must not keep serving the old prompt text
+        invalidate_prompt(prompt_id)
+        
         logger.info("Prompt updated successfully", prompt_id=prompt_id)
         
         # Return updated prompt
@@ -515,6 +519,7 @@ class PromptService:
         )
         
         if success:
+            invalidate_prompt(prompt_id)
             logger.info("Prompt deleted successfully", prompt_id=prompt_id)
         else:
             business_logger.log_error("prompt_service", "delete_prompt", "Failed to delete prompt in database")
@@ -2,42 +2,208 @@
 Stream management service layer
 Handles business logic for stream operations, validation, and access control
 """
+import copy
+import functools
 import json
+import threading
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from bson import ObjectId
+from pymongo.errors import OperationFailure
 
 from config import config
 from utilities.cosmos_connector import (
     ClientManager,
     db_create,
+    db_find_one,
     db_read,
     db_update,
-    get_document_by_id,
     safe_operation
 )
+from utilities.ttl_cache import TTLCache, make_cache_key
 from api.core.logging import get_logger, BusinessLogger
 
 logger = get_logger("api.services.stream_service")
 business_logger = BusinessLogger()
+_client_manager = ClientManager()
+
+
+@functools.lru_cache(maxsize=1024)
+def _oid(value: str) -> ObjectId:
+    """Parse an ObjectId, memoized for repeatedly polled stream IDs."""
+    return ObjectId(value)
+
+
+# Analytics group currency states besides a single currency string
+_NO_CURRENCY = object()
+_MIXED_CURRENCY = object()
+
+
+def _is_bad_hint_error(error: OperationFailure) -> bool:
+    """Whether the server rejected a hint naming a missing index."""
+    message = str(error).lower()
+    return (
+        "hint provided does not correspond to an existing index" in message
+        or (error.code == 2 and "hint" in message)
+    )
 
 
 class StreamService:
     """Service for managing streams with validation and access control"""
+
+    # Model documents change at most on admin edits; cache lookups
+    # by name so stream creation skips a round trip per request.
+    _model_cache = TTLCache(maxsize=256, ttl=60)
+
+    # Index hinted for client-scoped summaries (see ensure_indexes)
+    _CLIENT_CREATED_INDEX = [("clientId", 1), ("_metadata.createdAt", -1)]
+    _SUMMARY_MAX_TIME_MS = 5000
+
+    # Fields read by _format_stream_response; skips the potentially
+    # large requestData/responseData payloads when listing.
+    _LIST_PROJECTION = {
+        "clientId": 1,
+        "model": 1,
+        "temperature": 1,
+        "status": 1,
+        "processingMetrics": 1,
+        "clientReference": 1,
+        "_metadata": 1,
+    }
     
     def __init__(self):
         self._connection_string = config.db_connection_string
         self.db_name = config.db_name
         self.collection_name = "streams"
         self._cached_client = None
+        # Short-lived caches of list/summary responses. Keys embed a
+        # per-client write version so stream writes invalidate
+        # every filter combination for that client at once.
+        self._summary_cache = TTLCache(
+            maxsize=4096, ttl=config.stream_summary_cache_ttl
+        )
+        self._list_cache = TTLCache(
+            maxsize=512, ttl=config.stream_list_cache_ttl
+        )
+        self._read_versions: Dict[Optional[str], int] = {}
+        self._read_versions_lock = threading.Lock()
     
     @property
     def mongo_client(self):
         """Get a valid MongoDB client, reusing cached client if available and not closed."""
-        client_manager = ClientManager()
-        self._cached_client = client_manager.get_valid_client(self._connection_string, self._cached_client)
+        self._cached_client = _client_manager.get_valid_client(self._connection_string, self._cached_client)
         return self._cached_client
     
+    def ensure_indexes(self) -> None:
+        """
+        Create the indexes backing stream list, summary and analytics
+        queries. Safe to call repeatedly; existing indexes are kept.
+        """
+        collection = self.mongo_client[self.db_name][self.collection_name]
+        try:
+            collection.create_index([("_metadata.createdAt", 1)])
+            collection.create_index(self._CLIENT_CREATED_INDEX)
+            collection.create_index([("clientId", 1), ("status", 1)])
+            collection.create_index([("_metadata.isDeleted", 1)])
+            logger.info("Stream indexes ensured")
+        except Exception as e:
+            logger.warning("Could not create stream indexes", error=str(e))
+
+    def _read_cache_key(
+        self,
+        cache: TTLCache,
+        client_id: Optional[str],
+        is_admin: bool,
+        *parts: Any
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Build a versioned cache key for a list/summary query.
+
+        Args:
+            cache: Cache the key is for
+            client_id: Requesting client ID
+            is_admin: Whether the requester is an admin
+            *parts: Remaining query parameters
+
+        Returns:
+            Hashable key, or None if caching is disabled or the
+            parameters are not hashable
+        """
+        if cache.ttl <= 0:
+            return None
+        scope = None if is_admin else client_id
+        return make_cache_key(
+            scope, self._read_versions.get(scope, 0), *parts
+        )
+
+    def _invalidate_read_caches(self, client_id: Optional[str]) -> None:
+        """
+        Invalidate cached lists and summaries visible to a client.
+
+        Bumps the client's version and the admin (all-clients) version
+        so that existing cache keys are no longer reachable.
+
+        Args:
+            client_id: Client whose streams changed, or None if unknown
+        """
+        with self._read_versions_lock:
+            scopes = (None,) if client_id is None else (client_id, None)
+            for scope in scopes:
+                self._read_versions[scope] = (
+                    self._read_versions.get(scope, 0) + 1
+                )
+            if client_id is None:
+                # Unknown owner: drop everything rather than serve
+                # a stale client-scoped response.
+                self._summary_cache.clear()
+                self._list_cache.clear()
+
+    def _fetch_prompts_bulk(
+        self, prompt_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch prompts by ID with a single ``$in`` query.
+
+        Args:
+            prompt_ids: List of prompt IDs to fetch
+
+        Returns:
+            Prompt documents (content only) in the order of prompt_ids
+
+        Raises:
+            ValueError: On the first prompt ID that is invalid or
+                does not exist
+        """
+        object_ids = []
+        for prompt_id in prompt_ids:
+            if not ObjectId.is_valid(prompt_id):
+                raise ValueError(f"Prompt with ID '{prompt_id}' not found")
+            object_ids.append(ObjectId(prompt_id))
+
+        collection = self.mongo_client[self.db_name]["prompts"]
+        query = {
+            "_id": {"$in": object_ids},
+            "_metadata.isDeleted": {"$ne": True}
+        }
+
+        def find_operation():
+            return list(collection.find(query, {"content": 1}))
+
+        try:
+            docs = safe_operation(find_operation)
+        except Exception as e:
+            logger.error("Error fetching prompts", error=str(e))
+            raise ValueError(f"Prompt with ID '{prompt_ids[0]}' not found")
+
+        by_id = {str(doc["_id"]): doc for doc in docs}
+        prompts = []
+        for prompt_id, object_id in zip(prompt_ids, object_ids):
+            prompt = by_id.get(str(object_id))
+            if prompt is None:
+                raise ValueError(f"Prompt with ID '{prompt_id}' not found")
+            prompts.append(prompt)
+        return prompts
+
     def validate_additional_prompts(self, prompt_ids: List[str]) -> None:
         """
         Validate that all provided prompt IDs exist in the prompts collection.
@@ -51,27 +217,14 @@ class StreamService:
         if not prompt_ids:
             return
 
-        for prompt_id in prompt_ids:
-            try:
-                prompt = get_document_by_id(
-                    self.mongo_client,
-                    self.db_name,
-                    "prompts",
-                    prompt_id
-                )
-                if not prompt:
-                    raise ValueError(f"Prompt with ID '{prompt_id}' not found")
-            except Exception as e:
-                logger.error(f"Error validating prompt {prompt_id}", error=str(e))
-                raise ValueError(f"Prompt with ID '{prompt_id}' not found")
+        self._fetch_prompts_bulk(prompt_ids)
 
     def validate_and_fetch_prompts(
         self, prompt_ids: List[str]
     ) -> str:
         """
         Validate prompt IDs and return concatenated content in
-        a single DB pass — avoids the duplicate queries that
-        happen when validate and fetch are separate steps.
+        a single DB round trip.
 
         Args:
             prompt_ids: List of prompt IDs to validate and fetch
@@ -85,32 +238,11 @@ class StreamService:
         if not prompt_ids:
             return ""
 
-        parts = []
-        for prompt_id in prompt_ids:
-            try:
-                prompt = get_document_by_id(
-                    self.mongo_client,
-                    self.db_name,
-                    "prompts",
-                    prompt_id
-                )
-                if not prompt:
-                    raise ValueError(
-                        f"Prompt with ID '{prompt_id}' not found"
-                    )
-                if prompt.get("content"):
-                    parts.append(prompt["content"])
-            except ValueError:
-                raise
-            except Exception as e:
-                logger.error(
-                    f"Error fetching prompt {prompt_id}",
-                    error=str(e)
-                )
-                raise ValueError(
-                    f"Prompt with ID '{prompt_id}' not found"
-                )
-        return "\n".join(parts)
+        prompts = self._fetch_prompts_bulk(prompt_ids)
+        return "\n".join(
+            prompt["content"] for prompt in prompts
+            if prompt.get("content")
+        )
     
     def validate_model(self, model_name: str) -> Dict[str, Any]:
         """
@@ -125,8 +257,10 @@ class StreamService:
         Raises:
             ValueError: If model does not exist
         """
-        from utilities.cosmos_connector import db_find_one
-        
+        model_doc = self._model_cache.get(model_name)
+        if model_doc is not None:
+            return dict(model_doc)
+
         model_doc = db_find_one(
             self.mongo_client,
             self.db_name,
@@ -137,7 +271,21 @@ class StreamService:
         if not model_doc:
             raise ValueError(f"Model '{model_name}' not found")
         
-        return model_doc
+        self._model_cache.set(model_name, model_doc)
+        return dict(model_doc)
+
+    @classmethod
+    def invalidate_model_cache(cls, name: Optional[str] = None) -> None:
+        """
+        Drop cached model lookups.
+
+        Args:
+            name: Model name to invalidate, or None to drop all
+        """
+        if name is None:
+            cls._model_cache.clear()
+        else:
+            cls._model_cache.pop(name)
     
     def create_stream_record(
         self,
@@ -180,8 +328,9 @@ class StreamService:
             "responseData": None,
             "processingMetrics": None,
             "status": "streaming",
+            # createdAt and the other standard fields are
+            # stamped by db_create.
             "_metadata": {
-                "createdAt": datetime.utcnow().isoformat(),
                 "completedAt": None,
                 "isDeleted": False
             }
@@ -213,6 +362,8 @@ class StreamService:
                 "Failed to create stream record in database"
             )
 
+        self._invalidate_read_caches(client_id)
+
         logger.info(
             "Stream record created",
             stream_id=db_id,
@@ -227,7 +378,8 @@ class StreamService:
         stream_id: str,
         response_data: Dict[str, Any],
         processing_metrics: Dict[str, Any],
-        status: str = "completed"
+        status: str = "completed",
+        client_id: Optional[str] = None
     ) -> None:
         """
         Update a stream record with response data and metrics.
@@ -237,6 +389,8 @@ class StreamService:
             response_data: Response data including full text
             processing_metrics: Processing metrics including tokens and duration
             status: Final status (completed or error)
+            client_id: Optional owner of the stream, used to scope
+                summary cache invalidation
         """
         business_logger.log_operation(
             "stream_service",
@@ -259,6 +413,8 @@ class StreamService:
             stream_id,
             update_data
         )
+
+        self._invalidate_read_caches(client_id)
         
         logger.info(
             "Stream record updated successfully",
@@ -280,18 +436,25 @@ class StreamService:
         Raises:
             ValueError: If stream not found or access denied
         """
-        business_logger.log_operation(
-            "stream_service",
-            "get_stream_by_id",
-            stream_id=stream_id,
-            client_id=client_id
-        )
+        # Hot path (called per streaming RPC): avoid building the
+        # log kwargs at all when business logging is disabled.
+        if business_logger.is_enabled():
+            business_logger.log_operation(
+                "stream_service",
+                "get_stream_by_id",
+                stream_id=stream_id,
+                client_id=client_id
+            )
         
-        stream = get_document_by_id(
+        # Reject malformed IDs without a database round trip
+        if not ObjectId.is_valid(stream_id):
+            raise ValueError(f"Stream with ID '{stream_id}' not found")
+        
+        stream = db_find_one(
             self.mongo_client,
             self.db_name,
             self.collection_name,
-            stream_id
+            query={"_id": _oid(stream_id)}
         )
         
         if not stream:
@@ -347,25 +510,102 @@ class StreamService:
             client_id=client_id
         )
         
-        # Build query
+        query = self._build_filter_query(
+            client_id=client_id,
+            model=model,
+            status=status,
+            client_reference_filters=client_reference_filters,
+            date_from=date_from,
+            date_to=date_to,
+            is_admin=is_admin
+        )
+
+        cache_key = self._read_cache_key(
+            self._list_cache,
+            client_id,
+            is_admin,
+            model,
+            status,
+            limit,
+            client_reference_filters or {},
+            date_from,
+            date_to
+        )
+        if cache_key is not None:
+            cached = self._list_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        streams = db_read(
+            self.mongo_client,
+            self.db_name,
+            self.collection_name,
+            query=query,
+            limit=limit,
+            projection=self._LIST_PROJECTION
+        )
+        
+        # The clientId constraint is part of the query for non-admins,
+        # so every returned document already belongs to client_id.
+        result = [self._format_stream_response(s) for s in streams]
+
+        if cache_key is not None:
+            self._list_cache.set(cache_key, copy.deepcopy(result))
+        
+        logger.info("Listed streams", count=len(result), client_id=client_id)
+        return result
+    
+    def _build_filter_query(
+        self,
+        client_id: Optional[str] = None,
+        model: Optional[str] = None,
+        status: Optional[str] = None,
+        client_reference_filters: Optional[Dict[str, Any]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        is_admin: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Build the Mongo filter shared by stream list, summary and
+        analytics queries.
+
+        Args:
+            client_id: Client ID (required for non-admin users)
+            model: Optional filter by model
+            status: Optional filter by status
+            client_reference_filters: Optional dict of filters for
+                clientReference fields
+            date_from: Optional ISO datetime lower bound on
+                _metadata.createdAt
+            date_to: Optional ISO datetime upper bound on
+                _metadata.createdAt
+            is_admin: Whether the requester is an admin
+
+        Returns:
+            Query dictionary
+
+        Raises:
+            ValueError: If client_id is missing for a non-admin user
+        """
         if is_admin:
-            query = {}
+            query: Dict[str, Any] = {}
         else:
             if not client_id:
                 raise ValueError("Client ID is required for non-admin users")
             query = {"clientId": client_id}
 
-        # Add filters
-        if model is not None:
+        if model:
             query["model"] = model
 
-        if status is not None:
+        if status:
             query["status"] = status
-        
+
         if client_reference_filters:
-            for key, value in client_reference_filters.items():
-                if key:
-                    query[f"clientReference.{key}"] = value
+            query.update(
+                (f"clientReference.{key}", value)
+                for key, value in client_reference_filters.items()
+                if key
+            )
 
         if date_from or date_to:
             created_filter: Dict[str, Any] = {}
@@ -375,33 +615,8 @@ class StreamService:
                 created_filter["$lte"] = date_to
             query["_metadata.createdAt"] = created_filter
 
-        streams = db_read(
-            self.mongo_client,
-            self.db_name,
-            self.collection_name,
-            query=query,
-            limit=limit
-        )
-        
-        result = []
-        for stream in streams:
-            # Additional defensive check: ensure non-admin client only sees their own streams
-            if not is_admin:
-                stream_client_id = stream.get("clientId")
-                if stream_client_id != client_id:
-                    logger.warning(
-                        "Stream returned with incorrect clientId, filtering out",
-                        stream_id=str(stream.get("_id")),
-                        expected_client_id=client_id,
-                        actual_client_id=stream_client_id
-                    )
-                    continue
-            
-            result.append(self._format_stream_response(stream))
-        
-        logger.info("Listed streams", count=len(result), client_id=client_id)
-        return result
-    
+        return query
+
     def get_streams_summary(
         self,
         client_id: Optional[str] = None,
@@ -439,56 +654,136 @@ class StreamService:
             client_id=client_id
         )
         
-        # Build query
-        if is_admin:
-            query = {}
-        else:
-            if not client_id:
-                raise ValueError("Client ID is required for non-admin users")
-            query = {"clientId": client_id}
+        # The status filter is applied to the counts only, so it
+        # is kept out of the shared query.
+        query = self._build_filter_query(
+            client_id=client_id,
+            model=model,
+            client_reference_filters=client_reference_filters,
+            date_from=date_from,
+            date_to=date_to,
+            is_admin=is_admin
+        )
 
-        # Add filters
-        if model:
-            query["model"] = model
+        cache_key = self._read_cache_key(
+            self._summary_cache,
+            client_id,
+            is_admin,
+            model,
+            status,
+            client_reference_filters or {},
+            date_from,
+            date_to
+        )
+        if cache_key is not None:
+            cached = self._summary_cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
 
+        db = self.mongo_client[self.db_name]
+        collection = db[self.collection_name]
+
+        # Status counts honour the caller's status filter; metrics
+        # always roll up completed streams for the other filters.
+        base_query = {**query, "_metadata.isDeleted": {"$ne": True}}
+        status_stages: List[Dict[str, Any]] = []
         if status:
-            query["status"] = status
-        
-        if client_reference_filters:
-            for key, value in client_reference_filters.items():
-                if key:
-                    query[f"clientReference.{key}"] = value
+            status_stages.append({"$match": {"status": status}})
 
-        if date_from or date_to:
-            created_filter: Dict[str, Any] = {}
-            if date_from:
-                created_filter["$gte"] = date_from
-            if date_to:
-                created_filter["$lte"] = date_to
-            query["_metadata.createdAt"] = created_filter
+        # Only streams with a non-empty currency contribute cost data
+        priced = {"$gt": ["$processingMetrics.currency", ""]}
 
-        # Use aggregation to count by status
-        db = self.mongo_client[self.db_name]
-        collection = db[self.collection_name]
-        
-        # Build aggregation pipeline
+        def priced_sum(field: str) -> Dict[str, Any]:
+            return {"$sum": {"$cond": [priced, f"$processingMetrics.{field}", 0]}}
+
+        # Count by status and roll up metrics server-side so only the
+        # totals cross the wire, not every completed stream document.
         pipeline = [
-            {"$match": query},
-            {"$match": {"_metadata.isDeleted": {"$ne": True}}},  # Exclude soft-deleted
+            {"$match": base_query},
             {
-                "$group": {
-                    "_id": "$status",
-                    "count": {"$sum": 1}
+                "$facet": {
+                    "byStatus": status_stages + [
+                        {
+                            "$group": {
+                                "_id": "$status",
+                                "count": {"$sum": 1}
+                            }
+                        }
+                    ],
+                    "metrics": [
+                        {
+                            "$match": {
+                                "status": "completed",
+                                "processingMetrics": {"$ne": None}
+                            }
+                        },
+                        {
+                            "$group": {
+                                "_id": None,
+                                "inputTokens": {"$sum": "$processingMetrics.inputTokens"},
+                                "outputTokens": {"$sum": "$processingMetrics.outputTokens"},
+                                "totalTokens": {"$sum": "$processingMetrics.totalTokens"},
+                                "duration": {"$sum": "$processingMetrics.duration"},
+                                "llmDuration": {"$sum": "$processingMetrics.llmDuration"},
+                                "overheadDuration": {"$sum": "$processingMetrics.overheadDuration"},
+                                "inputCost": priced_sum("inputCost"),
+                                "outputCost": priced_sum("outputCost"),
+                                "totalCost": priced_sum("totalCost"),
+                                "currencies": {
+                                    "$addToSet": {
+                                        "$cond": [priced, "$processingMetrics.currency", None]
+                                    }
+                                }
+                            }
+                        },
+                        {
+                            "$addFields": {
+                                "currencies": {"$setDifference": ["$currencies", [None]]}
+                            }
+                        }
+                    ]
                 }
             }
         ]
         
+        # Bound the query time, and steer client-scoped summaries onto
+        # the (clientId, createdAt) index rather than letting the
+        # planner pick a collection scan.
+        aggregate_options: Dict[str, Any] = {
+            "maxTimeMS": self._SUMMARY_MAX_TIME_MS
+        }
+        if not is_admin:
+            aggregate_options["hint"] = self._CLIENT_CREATED_INDEX
+        
         try:
             # Execute aggregation with retry logic
             def aggregate_operation():
-                return list(collection.aggregate(pipeline))
+                try:
+                    return list(
+                        collection.aggregate(pipeline, **aggregate_options)
+                    )
+                except OperationFailure as e:
+                    # Only a rejected hint is retried; timeouts
+                    # (MaxTimeMSExpired) and throttling re-raise so the
+                    # time bound and safe_operation's retry still apply.
+                    if (
+                        "hint" not in aggregate_options
+                        or not _is_bad_hint_error(e)
+                    ):
+                        raise
+                    # Index missing (e.g. ensure_indexes failed):
+                    # fall back to the planner's choice.
+                    logger.warning(
+                        "Summary index hint rejected, retrying without it",
+                        error=str(e)
+                    )
+                    aggregate_options.pop("hint")
+                    return list(
+                        collection.aggregate(pipeline, **aggregate_options)
+                    )
             
-            results = safe_operation(aggregate_operation)
+            facets = safe_operation(aggregate_operation)
+            facets = facets[0] if facets else {}
             
             # Initialize counts for all statuses
             summary = {
@@ -499,85 +794,29 @@ class StreamService:
             }
             
             # Populate counts from aggregation results
-            for result in results:
+            for result in facets.get("byStatus", []):
                 status_val = result.get("_id")
                 count = result.get("count", 0)
                 if status_val in summary:
                     summary[status_val] = count
                     summary["total"] += count
             
-            # Aggregate processingMetrics from completed streams
-            metrics_query = {
-                **query,
-                "status": "completed",
-                "processingMetrics": {"$exists": True, "$ne": None}
-            }
-            
-            def find_metrics_operation():
-                return list(collection.find(metrics_query, {"processingMetrics": 1}))
-            
-            streams_with_metrics = safe_operation(find_metrics_operation)
-            
-            if streams_with_metrics:
-                # Initialize aggregated metrics
-                total_input_tokens = 0
-                total_output_tokens = 0
-                total_tokens = 0
-                total_duration = 0.0
-                total_llm_duration = 0.0
-                total_overhead_duration = 0.0
-                total_input_cost = 0.0
-                total_output_cost = 0.0
-                total_cost = 0.0
-                currencies = set()
-                streams_with_currency = 0
-                streams_without_currency = 0
-                
-                # Aggregate metrics from all streams
-                for stream in streams_with_metrics:
-                    metrics = stream.get("processingMetrics", {})
-                    if not metrics:
-                        continue
-                    
-                    # Sum always-available fields
-                    if "inputTokens" in metrics:
-                        total_input_tokens += metrics.get("inputTokens", 0)
-                    if "outputTokens" in metrics:
-                        total_output_tokens += metrics.get("outputTokens", 0)
-                    if "totalTokens" in metrics:
-                        total_tokens += metrics.get("totalTokens", 0)
-                    if "duration" in metrics:
-                        total_duration += metrics.get("duration", 0.0)
-                    if "llmDuration" in metrics:
-                        total_llm_duration += metrics.get("llmDuration", 0.0)
-                    if "overheadDuration" in metrics:
-                        total_overhead_duration += metrics.get(
-                            "overheadDuration", 0.0
-                        )
-                    
-                    # Collect cost data and currencies
-                    if "currency" in metrics and metrics["currency"]:
-                        currencies.add(metrics["currency"])
-                        streams_with_currency += 1
-                        # Sum cost fields if they exist
-                        if "inputCost" in metrics:
-                            total_input_cost += metrics.get("inputCost", 0.0)
-                        if "outputCost" in metrics:
-                            total_output_cost += metrics.get("outputCost", 0.0)
-                        if "totalCost" in metrics:
-                            total_cost += metrics.get("totalCost", 0.0)
-                    else:
-                        streams_without_currency += 1
+            metrics_results = facets.get("metrics", [])
+            if metrics_results:
+                totals = metrics_results[0]
+                currencies = totals.get("currencies", [])
                 
                 # Build processingMetrics response
                 processing_metrics = {
-                    "inputTokens": total_input_tokens,
-                    "outputTokens": total_output_tokens,
-                    "totalTokens": total_tokens,
-                    "duration": round(total_duration, 2),
-                    "llmDuration": round(total_llm_duration, 2),
-                    "totalDuration": round(total_duration, 2),
-                    "overheadDuration": round(total_overhead_duration, 2)
+                    "inputTokens": totals.get("inputTokens", 0),
+                    "outputTokens": totals.get("outputTokens", 0),
+                    "totalTokens": totals.get("totalTokens", 0),
+                    "duration": round(totals.get("duration", 0.0), 2),
+                    "llmDuration": round(totals.get("llmDuration", 0.0), 2),
+                    "totalDuration": round(totals.get("duration", 0.0), 2),
+                    "overheadDuration": round(
+                        totals.get("overheadDuration", 0.0), 2
+                    )
                 }
                 
                 # Include cost data if:
@@ -586,10 +825,10 @@ class StreamService:
                 if len(currencies) == 1:
                     # All streams with cost data use the same currency
                     # Include aggregated costs (only from streams that had cost data)
-                    processing_metrics["inputCost"] = total_input_cost
-                    processing_metrics["outputCost"] = total_output_cost
-                    processing_metrics["totalCost"] = total_cost
-                    processing_metrics["currency"] = currencies.pop()
+                    processing_metrics["inputCost"] = totals.get("inputCost", 0.0)
+                    processing_metrics["outputCost"] = totals.get("outputCost", 0.0)
+                    processing_metrics["totalCost"] = totals.get("totalCost", 0.0)
+                    processing_metrics["currency"] = currencies[0]
                 elif len(currencies) > 1:
                     # Multiple different currencies found across streams
                     processing_metrics["inputCost"] = None
@@ -608,6 +847,9 @@ class StreamService:
                 # No streams with metrics found
                 summary["processingMetrics"] = None
             
+            if cache_key is not None:
+                self._summary_cache.set(cache_key, copy.deepcopy(summary))
+
             logger.info("Stream summary retrieved", client_id=client_id, summary=summary)
             return summary
             
@@ -620,7 +862,8 @@ class StreamService:
         client_id: Optional[str] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
-        is_admin: bool = False
+        is_admin: bool = False,
+        include_data_points: bool = True
     ) -> Dict[str, Any]:
         """
         Return per-stream processing metrics with grouping
@@ -635,6 +878,9 @@ class StreamService:
                 _metadata.createdAt
             date_to: Optional ISO datetime upper bound on
                 _metadata.createdAt
+            include_data_points: Whether to also fetch the per-stream
+                data points (a second read); groups are always
+                returned
 
         Returns:
             Dictionary with dataPoints, groups, totalCount,
@@ -649,65 +895,122 @@ class StreamService:
             client_id=client_id
         )
 
-        query: Dict[str, Any] = {
+        query = self._build_filter_query(
+            client_id=client_id,
+            date_from=date_from,
+            date_to=date_to,
+            is_admin=is_admin
+        )
+        query.update({
             "status": "completed",
             "processingMetrics": {"$exists": True, "$ne": None},
             "_metadata.isDeleted": {"$ne": True},
-        }
-        if not is_admin:
-            if not client_id:
-                raise ValueError("Client ID is required for non-admin users")
-            query["clientId"] = client_id
+        })
 
-        if date_from or date_to:
-            created_filter: Dict[str, Any] = {}
-            if date_from:
-                created_filter["$gte"] = date_from
-            if date_to:
-                created_filter["$lte"] = date_to
-            query["_metadata.createdAt"] = created_filter
+        # Group server-side; only one row per distinct
+        # (model, clientReference, promptIds) comes back.
+        pipeline = [
+            {"$match": query},
+            {
+                "$group": {
+                    "_id": {
+                        "model": "$model",
+                        "clientReference": "$clientReference",
+                        "promptIds": "$requestData.additionalPrompts"
+                    },
+                    "count": {"$sum": 1},
+                    "firstCreatedAt": {"$min": "$_metadata.createdAt"},
+                    "tokensIn": {"$sum": "$processingMetrics.inputTokens"},
+                    "tokensOut": {"$sum": "$processingMetrics.outputTokens"},
+                    "tokensTotal": {"$sum": "$processingMetrics.totalTokens"},
+                    "duration": {
+                        "$sum": {
+                            "$ifNull": [
+                                "$processingMetrics.totalDuration",
+                                "$processingMetrics.duration"
+                            ]
+                        }
+                    },
+                    "cost": {
+                        "$sum": {
+                            "$cond": [
+                                {"$gt": ["$processingMetrics.currency", ""]},
+                                "$processingMetrics.totalCost",
+                                0
+                            ]
+                        }
+                    },
+                    "currencies": {
+                        "$addToSet": {
+                            "$cond": [
+                                {"$gt": ["$processingMetrics.currency", ""]},
+                                "$processingMetrics.currency",
+                                None
+                            ]
+                        }
+                    }
+                }
+            },
+            {"$sort": {"firstCreatedAt": 1}}
+        ]
 
         projection = {
-            "responseData": 0,
+            "model": 1,
+            "clientReference": 1,
+            "requestData.additionalPrompts": 1,
+            "processingMetrics": 1,
+            "_metadata.createdAt": 1,
         }
 
         try:
             db = self.mongo_client[self.db_name]
             collection = db[self.collection_name]
 
-            def find_operation():
+            def aggregate_operation():
                 return list(
-                    collection.find(query, projection)
-                    .sort("_metadata.createdAt", 1)
+                    collection.aggregate(pipeline, allowDiskUse=True)
                 )
 
-            streams = safe_operation(find_operation)
+            group_rows = safe_operation(aggregate_operation)
 
             data_points: List[Dict[str, Any]] = []
-            group_map: Dict[
-                Tuple[str, str, str], Dict[str, Any]
-            ] = {}
+            if include_data_points:
+                # Iterate the cursor so only one batch of documents
+                # is resident at a time.
+                def find_operation():
+                    return (
+                        collection.find(query, projection)
+                        .sort("_metadata.createdAt", 1)
+                        .batch_size(500)
+                    )
 
-            for stream in streams:
-                request_data = stream.get("requestData", {})
-                metrics = stream.get("processingMetrics", {})
-                client_ref = stream.get("clientReference")
-                model = stream.get("model", "")
-                prompt_ids = (
-                    request_data.get("additionalPrompts")
-                )
+                for stream in safe_operation(find_operation):
+                    request_data = stream.get("requestData", {})
+                    data_points.append({
+                        "streamId": str(stream["_id"]),
+                        "createdAt": (
+                            stream.get("_metadata", {})
+                            .get("createdAt", "")
+                        ),
+                        "model": stream.get("model", ""),
+                        "clientReference": stream.get("clientReference"),
+                        "promptIds": request_data.get("additionalPrompts"),
+                        "processingMetrics": stream.get(
+                            "processingMetrics", {}
+                        ),
+                    })
 
-                data_points.append({
-                    "streamId": str(stream["_id"]),
-                    "createdAt": (
-                        stream.get("_metadata", {})
-                        .get("createdAt", "")
-                    ),
-                    "model": model,
-                    "clientReference": client_ref,
-                    "promptIds": prompt_ids,
-                    "processingMetrics": metrics,
-                })
+            # Mongo compares embedded documents and arrays by order;
+            # merge rows whose clientReference key order or prompt
+            # order differ so grouping stays order-insensitive.
+            group_map: Dict[
+                Tuple[str, str, Tuple[str, ...]], Dict[str, Any]
+            ] = {}
+            for row in group_rows:
+                row_id = row.get("_id") or {}
+                model = row_id.get("model", "")
+                client_ref = row_id.get("clientReference")
+                prompt_ids = row_id.get("promptIds")
 
                 group_key = self._analytics_group_key(
                     model, client_ref, prompt_ids
@@ -723,35 +1026,32 @@ class StreamService:
                         "_tokens_total": 0,
                         "_duration": 0.0,
                         "_cost": 0.0,
-                        "_currencies": set(),
+                        "_currency": _NO_CURRENCY,
                     }
 
                 grp = group_map[group_key]
-                grp["count"] += 1
-                grp["_tokens_in"] += metrics.get(
-                    "inputTokens", 0
-                )
-                grp["_tokens_out"] += metrics.get(
-                    "outputTokens", 0
-                )
-                grp["_tokens_total"] += metrics.get(
-                    "totalTokens", 0
-                )
-                grp["_duration"] += metrics.get(
-                    "totalDuration",
-                    metrics.get("duration", 0.0)
-                )
-                currency = metrics.get("currency")
-                if currency:
-                    grp["_currencies"].add(currency)
-                    grp["_cost"] += metrics.get(
-                        "totalCost", 0.0
-                    )
+                grp["count"] += row.get("count", 0)
+                grp["_tokens_in"] += row.get("tokensIn", 0)
+                grp["_tokens_out"] += row.get("tokensOut", 0)
+                grp["_tokens_total"] += row.get("tokensTotal", 0)
+                grp["_duration"] += row.get("duration", 0.0)
+                grp["_cost"] += row.get("cost", 0.0)
+                # Track one currency until a second one shows up;
+                # after that the group is mixed and nothing changes.
+                if grp["_currency"] is not _MIXED_CURRENCY:
+                    for currency in row.get("currencies", []):
+                        if not currency:
+                            continue
+                        if grp["_currency"] is _NO_CURRENCY:
+                            grp["_currency"] = currency
+                        elif grp["_currency"] != currency:
+                            grp["_currency"] = _MIXED_CURRENCY
+                            break
 
             groups: List[Dict[str, Any]] = []
             for grp in group_map.values():
-                currencies = grp.pop("_currencies")
-                uniform = len(currencies) == 1
+                currency = grp.pop("_currency")
+                uniform = currency not in (_NO_CURRENCY, _MIXED_CURRENCY)
                 groups.append({
                     "model": grp["model"],
                     "clientReference": grp["clientReference"],
@@ -768,17 +1068,16 @@ class StreamService:
                             grp["_cost"] if uniform
                             else None
                         ),
-                        "currency": (
-                            currencies.pop() if uniform
-                            else None
-                        ),
+                        "currency": currency if uniform else None,
                     },
                 })
 
+            total_count = sum(grp["count"] for grp in groups)
+
             result = {
                 "dataPoints": data_points,
                 "groups": groups,
-                "totalCount": len(data_points),
+                "totalCount": total_count,
                 "dateRange": {
                     "from": date_from,
                     "to": date_to,
@@ -788,7 +1087,7 @@ class StreamService:
             logger.info(
                 "Stream analytics retrieved",
                 client_id=client_id,
-                total_count=len(data_points),
+                total_count=total_count,
                 group_count=len(groups)
             )
             return result
@@ -808,16 +1107,16 @@ class StreamService:
         model: str,
         client_reference: Optional[Dict[str, Any]],
         prompt_ids: Optional[List[str]]
-    ) -> Tuple[str, str, str]:
+    ) -> Tuple[str, str, Tuple[str, ...]]:
         """Build a hashable key for analytics grouping."""
+        # clientReference may nest dicts/lists, so it still goes
+        # through json.dumps; prompt IDs are flat strings and a
+        # sorted tuple is enough.
         ref_key = (
             json.dumps(client_reference, sort_keys=True)
             if client_reference else ""
         )
-        prompts_key = (
-            json.dumps(sorted(prompt_ids))
-            if prompt_ids else ""
-        )
+        prompts_key = tuple(sorted(prompt_ids)) if prompt_ids else ()
         return (model, ref_key, prompts_key)
 
     def _format_stream_response(self, stream: Dict[str, Any]) -> Dict[str, Any]:
@@ -842,14 +1141,12 @@ class StreamService:
         }
 
 
-# Singleton instance
-_stream_service_instance = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_stream_service() -> StreamService:
-    """Get the singleton StreamService instance."""
-    global _stream_service_instance
-    if _stream_service_instance is None:
-        _stream_service_instance = StreamService()
-    return _stream_service_instance
+    """
+    Get the singleton StreamService instance.
 
+    Cached per process; concurrent requests share the instance and
+    the MongoClient connection pool handles concurrency.
+    """
+    return StreamService()
@@ -1,13 +1,18 @@
 """
 Worker Manager - Singleton managing worker threads and lifecycle
 """
+import functools
+import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
-from datetime import datetime
 
 from config import config
 from utilities.cosmos_connector import get_mongo_client
+from utilities.ttl_cache import TTLCache
 from api.services.worker_service import get_worker_service
 from api.models.worker_models import WorkerStatus
 from api.core.logging import get_logger
@@ -16,194 +21,408 @@ from api.core.logging import get_logger
 import sys
 from pathlib import Path
 project_root = Path(__file__).resolve().parent.parent.parent
-if str(project_root / "utilities") not in sys.path:
-    sys.path.insert(0, str(project_root / "utilities"))
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-if str(project_root / "llm_workers") not in sys.path:
-    sys.path.insert(0, str(project_root / "llm_workers"))
+for _path in (project_root / "utilities", project_root, project_root / "llm_workers"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 from llm_queue_worker import QueueWorker
 
 logger = get_logger("api.services.worker_manager")
 
+# QueueWorker arguments shared by every managed worker
+_make_queue_worker = functools.partial(
+    QueueWorker,
+    connection_string=config.db_connection_string,
+    db_name=config.db_name,
+    log_level="INFO"
+)
 
-class WorkerManager:
-    """Singleton managing worker threads and lifecycle"""
+
+def _worker_names(worker_identifier: str, worker_id: str) -> tuple:
+    """
+    Names used for a managed worker.
     
-    _instance: Optional['WorkerManager'] = None
-    _lock = threading.Lock()
+    Args:
+        worker_identifier: Worker identifier from the worker document
+        worker_id: Worker document ID
+        
+    Returns:
+        Tuple of (QueueWorker ID, thread name)
+    """
+    return f"{worker_identifier}-{worker_id[:8]}", f"Worker-{worker_identifier}"
+
+
+_STATUS_RUNNING = WorkerStatus.RUNNING.value
+_STATUS_STOPPED = WorkerStatus.STOPPED.value
+_STATUS_ERROR = WorkerStatus.ERROR.value
+
+# Idle polling backs off up to this multiple of pollInterval, capped at
+# the largest maxPollInterval a worker config accepts, unless the worker
+# config sets maxPollInterval
+_DEFAULT_BACKOFF_FACTOR = 10
+_MAX_DEFAULT_POLL_INTERVAL = 3600
+
+
+# Minimum seconds between repeats of the same rate-limited warning
+_WARN_INTERVAL = 5.0
+_last_warned: Dict[str, float] = {}
+_suppressed_warnings: Dict[str, int] = {}
+
+
+def _warn_rate_limited(message: str, **kwargs):
+    """
+    Log a warning at most once per _WARN_INTERVAL per message.
     
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    Keeps failing DB writes on error paths observable without flooding
+    the log when many workers hit the same failure.
+    
+    Args:
+        message: Warning message, also used as the rate-limit key
+        **kwargs: Structured log fields
+    """
+    now = time.monotonic()
+    if now - _last_warned.get(message, float("-inf")) < _WARN_INTERVAL:
+        _suppressed_warnings[message] = _suppressed_warnings.get(message, 0) + 1
+        return
+    _last_warned[message] = now
+    suppressed = _suppressed_warnings.pop(message, 0)
+    logger.warning(message, suppressed_since_last=suppressed, **kwargs)
+
+
+@contextmanager
+def _suppressed_logging(level: int = logging.ERROR):
+    """
+    Temporarily raise the level of the API logger tree.
+    
+    Used to keep startup/shutdown output terse. Only the "api" logger is
+    touched, so unrelated loggers and the root level are left alone.
+    
+    Args:
+        level: Level to apply for the duration of the block
+    """
+    api_logger = logging.getLogger("api")
+    old_level = api_logger.level
+    api_logger.setLevel(level)
+    try:
+        yield
+    finally:
+        api_logger.setLevel(old_level)
+
+
+@dataclass(slots=True)
+class _WorkerRecord:
+    """In-process state of one running worker"""
+    
+    thread: threading.Thread
+    stop_event: threading.Event
+    queue_worker: Any
+    # Set by the worker thread as it exits
+    done: threading.Event
+
+
+class WorkerManager:
+    """Manages worker threads and lifecycle; use get_worker_manager()"""
     
     def __init__(self):
-        if self._initialized:
-            return
-        
         self.worker_service = get_worker_service()
-        self.worker_threads: Dict[str, threading.Thread] = {}
-        self.worker_stop_events: Dict[str, threading.Event] = {}
-        self.worker_instances: Dict[str, Any] = {}  # Store QueueWorker instances
-        self.manager_lock = threading.Lock()
-        self._initialized = True
+        # Copy-on-write registry: writers swap in a new dict under
+        # _workers_lock, readers use whatever dict they load without a lock
+        self._workers: Dict[str, _WorkerRecord] = {}
+        self._workers_lock = threading.Lock()
+        # Status this manager last wrote for each worker
+        self._last_known_status: Dict[str, str] = {}
+        # Per-worker lifecycle locks; _locks_lock only guards insertion
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        # Short-lived cache of worker documents for status polling;
+        # invalidated on every start/stop
+        self._worker_cache = TTLCache(maxsize=1024, ttl=config.worker_list_cache_ttl)
+        # Background status reconciliation; started once startup restarts
+        # are done so it cannot mark not-yet-restarted workers stopped
+        self._watchdog_stop = threading.Event()
+        self._watchdog_thread: Optional[threading.Thread] = None
     
-    def load_workers_from_db(self):
+    def _worker_lock(self, worker_id: str) -> threading.Lock:
         """
-        Load all workers from database and restart workers that were running.
-        This is called on startup.
-        """
-        # Temporarily suppress verbose logging during startup
-        import logging
-        old_level = logging.getLogger().level
-        logging.getLogger().setLevel(logging.ERROR)
+        Get the lifecycle lock for a worker, creating it on first use.
         
-        # Don't acquire lock here since _restart_worker will need it
-        try:
-            # Load all workers from database
-            workers = self.worker_service.list_workers(is_admin=True)
-            
-            # Track workers that need restarting
-            workers_to_restart = []
-            
-            for worker in workers:
-                worker_id = worker["workerId"]
-                current_status = worker.get("status")
-                
-                if current_status == WorkerStatus.RUNNING.value:
-                    workers_to_restart.append(worker_id)
-            
-            # Simple startup message
-            if workers_to_restart:
-                print(f"\n🔄 Restarting {len(workers_to_restart)} worker(s) from previous session...")
-            
-            # Attempt to restart workers that were running
-            restart_success = 0
-            restart_failed = 0
-            
-            for worker_id in workers_to_restart:
-                try:
-                    # First set to stopped, then start fresh
-                    self._restart_worker(worker_id)
-                    restart_success += 1
-                    print(f"   ✅ Worker {worker_id[:8]}... restarted")
-                except Exception as e:
-                    restart_failed += 1
-                    print(f"   ❌ Worker {worker_id[:8]}... failed: {str(e)}")
-                    # Set to error state
-                    try:
-                        self.worker_service.update_worker(
-                            worker_id=worker_id,
-                            status=WorkerStatus.ERROR,
-                            thread_info=None,
-                            is_admin=True
-                        )
-                    except Exception as update_error:
-                        pass  # Ignore errors during startup
+        Args:
+            worker_id: Worker document ID
             
-            if workers_to_restart:
-                print(f"✨ Worker restart complete: {restart_success} successful, {restart_failed} failed\n")
-        except Exception as e:
-            print(f"❌ Error loading workers: {str(e)}\n")
-        finally:
-            # Restore logging level
-            logging.getLogger().setLevel(old_level)
+        Returns:
+            Lock serializing start/stop of this worker
+        """
+        lock = self._locks.get(worker_id)
+        if lock is None:
+            with self._locks_lock:
+                lock = self._locks.setdefault(worker_id, threading.Lock())
+        return lock
     
-    def _restart_worker(self, worker_id: str):
+    def _discard_worker(self, worker_id: str, thread: Optional[threading.Thread] = None):
         """
-        Restart a worker by first ensuring it's stopped, then starting it.
+        Drop the bookkeeping entries for a worker.
         
         Args:
             worker_id: Worker document ID
+            thread: If given, only discard when this is still the
+                registered thread (a restarted worker keeps its entries)
+        """
+        with self._workers_lock:
+            record = self._workers.get(worker_id)
+            if record is None or (thread is not None and record.thread is not thread):
+                return
+            workers = dict(self._workers)
+            del workers[worker_id]
+            self._workers = workers
+    
+    def _register_worker(self, worker_id: str, record: _WorkerRecord):
+        """
+        Publish the record for a worker, replacing any previous one.
+        
+        Args:
+            worker_id: Worker document ID
+            record: Record to publish
+        """
+        with self._workers_lock:
+            self._workers = {**self._workers, worker_id: record}
+    
+    def _set_status(self, worker_id: str, status: WorkerStatus, thread_info: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Write a worker's status and remember it.
+        
+        Args:
+            worker_id: Worker document ID
+            status: New status
+            thread_info: Optional thread information
+            
+        Returns:
+            Updated worker dictionary
         """
-        # First ensure worker is marked as stopped
         try:
-            self.worker_service.update_worker(
+            worker = self.worker_service.update_worker(
                 worker_id=worker_id,
-                status=WorkerStatus.STOPPED,
-                thread_info=None,
+                status=status,
+                thread_info=thread_info,
                 is_admin=True
             )
+        except Exception:
+            self._invalidate_cache(worker_id)
+            raise
+        self._last_known_status[worker_id] = status.value
+        # Seed the cache with the document just written so the status
+        # read that usually follows a start/stop needs no round trip
+        self._worker_cache.set(worker_id, worker)
+        return worker
+    
+    def _try_set_status(self, worker_id: str, status: WorkerStatus):
+        """
+        Best-effort status write for fallback paths.
+        
+        Skipped when this manager already wrote the same status; errors
+        are logged rather than raised.
+        
+        Args:
+            worker_id: Worker document ID
+            status: New status
+        """
+        if self._last_known_status.get(worker_id) == status.value:
+            return
+        try:
+            self._set_status(worker_id, status)
         except Exception as e:
-            pass  # Ignore errors during restart
+            _warn_rate_limited("Failed to update worker status", worker_id=worker_id, status=status.value, error=str(e))
+    
+    def _invalidate_cache(self, worker_id: str):
+        """
+        Drop the cached document of a worker whose state changed.
+        
+        Args:
+            worker_id: Worker document ID
+        """
+        self._worker_cache.pop(worker_id)
+    
+    def forget_worker(self, worker_id: str):
+        """
+        Drop everything this manager remembers about a deleted worker.
+        
+        The worker must already be stopped.
+        
+        Args:
+            worker_id: Worker document ID
+        """
+        with self._worker_lock(worker_id):
+            self._forget_locked(worker_id)
+    
+    def _forget_locked(self, worker_id: str):
+        """
+        Drop a worker's remembered status, cached document and lock.
+        
+        The caller holds the worker's lock.
         
-        # Now start the worker
-        self.start_worker(worker_id)
+        Args:
+            worker_id: Worker document ID
+        """
+        self._last_known_status.pop(worker_id, None)
+        self._invalidate_cache(worker_id)
+        with self._locks_lock:
+            self._locks.pop(worker_id, None)
     
-    def start_worker(self, worker_id: str) -> bool:
+    def load_workers_from_db(self):
+        """
+        Load all workers from database and restart workers that were running.
+        This is called on startup.
+        """
+        restarted = []
+        failed = []
+        
+        # Temporarily suppress verbose logging during startup
+        with _suppressed_logging():
+            try:
+                # Load all workers from database
+                workers = self.worker_service.list_workers(is_admin=True)
+                
+                # Track workers that need restarting
+                workers_to_restart = []
+                
+                for worker in workers:
+                    worker_id = worker["workerId"]
+                    current_status = worker.get("status")
+                    
+                    if current_status == _STATUS_RUNNING:
+                        workers_to_restart.append(worker_id)
+                
+                # Reset them to stopped in one write so start_worker
+                # accepts them
+                if workers_to_restart:
+                    try:
+                        reset = self.worker_service.bulk_reset_running_to_stopped(workers_to_restart)
+                        for worker_id in workers_to_restart:
+                            self._last_known_status[worker_id] = _STATUS_STOPPED
+                        if reset != len(workers_to_restart):
+                            logger.warning("Not all running workers were reset", expected=len(workers_to_restart), reset=reset)
+                    except Exception as e:
+                        logger.error("Failed to reset running workers", count=len(workers_to_restart), error=str(e))
+                
+                # Attempt to restart workers that were running; restarts
+                # are I/O bound and start_worker locks per worker, so
+                # overlap them
+                if workers_to_restart:
+                    with ThreadPoolExecutor(
+                        max_workers=min(16, len(workers_to_restart)),
+                        thread_name_prefix="WorkerRestart"
+                    ) as pool:
+                        futures = {
+                            pool.submit(self.start_worker, worker_id): worker_id
+                            for worker_id in workers_to_restart
+                        }
+                        for future in as_completed(futures):
+                            worker_id = futures[future]
+                            try:
+                                if future.result():
+                                    restarted.append(worker_id)
+                                else:
+                                    failed.append((worker_id, "Worker was not started"))
+                            except Exception as e:
+                                failed.append((worker_id, str(e)))
+                
+                # Set failed workers to error state in one update
+                failed_ids = [
+                    worker_id for worker_id, _ in failed
+                    if self._last_known_status.get(worker_id) != _STATUS_ERROR
+                ]
+                if failed_ids:
+                    try:
+                        self.worker_service.bulk_update_status(failed_ids, WorkerStatus.ERROR)
+                        for worker_id in failed_ids:
+                            self._last_known_status[worker_id] = _STATUS_ERROR
+                    except Exception as update_error:
+                        logger.error("Failed to mark workers as errored", count=len(failed_ids), error=str(update_error))
+            except Exception as e:
+                logger.error("Error loading workers", error=str(e))
+        
+        # One summary line, emitted once suppression is lifted
+        if restarted or failed:
+            logger.info(
+                "Workers restarted from previous session",
+                restarted=len(restarted),
+                failed=len(failed),
+                failures={worker_id: error for worker_id, error in failed}
+            )
+        
+        self._start_watchdog()
+    
+    def start_worker(self, worker_id: str, worker: Optional[Dict[str, Any]] = None) -> bool:
         """
         Start a worker thread.
         
         Args:
             worker_id: Worker document ID
+            worker: Worker dictionary the caller has already read (as
+                returned by WorkerService); skips reading it again
             
         Returns:
             True if worker started successfully, False otherwise
         """
-        with self.manager_lock:
+        with self._worker_lock(worker_id):
             # Check if worker is already running
-            if worker_id in self.worker_threads:
-                thread = self.worker_threads[worker_id]
-                if thread.is_alive():
-                    return False
+            record = self._workers.get(worker_id)
+            if record is not None and record.thread.is_alive():
+                return False
             
             try:
-                # Get worker from database
-                worker = self.worker_service.get_worker_by_id(worker_id, is_admin=True)
+                # Get worker from database unless the caller already has it
+                if worker is None:
+                    worker = self.worker_service.get_worker_by_id(worker_id, is_admin=True)
                 
                 # Check if worker is already running in DB
-                if worker.get("status") == WorkerStatus.RUNNING.value:
+                if worker.get("status") == _STATUS_RUNNING:
                     return False
                 
                 # Get worker configuration
                 worker_config = worker["config"]
                 client_id = worker["clientId"]
                 worker_identifier = worker["workerId"]
+                poll_interval = worker_config["pollInterval"]
+                max_poll_interval = worker_config.get("maxPollInterval") or min(
+                    _DEFAULT_BACKOFF_FACTOR * poll_interval, _MAX_DEFAULT_POLL_INTERVAL
+                )
+                queue_worker_id, thread_name = _worker_names(worker_identifier, worker_id)
                 
-                # Create stop event
+                # Create stop event, and the event the thread sets on exit
                 stop_event = threading.Event()
-                self.worker_stop_events[worker_id] = stop_event
+                done = threading.Event()
                 
-                # Create QueueWorker instance
-                queue_worker = QueueWorker(
-                    worker_id=f"{worker_identifier}-{worker_id[:8]}",
+                # Create QueueWorker instance (connection settings are
+                # bound once in _make_queue_worker)
+                queue_worker = _make_queue_worker(
+                    worker_id=queue_worker_id,
                     client_id=client_id,
-                    connection_string=config.db_connection_string,
-                    db_name=config.db_name,
-                    poll_interval=worker_config["pollInterval"],
+                    poll_interval=poll_interval,
                     max_items_per_batch=worker_config["maxItemsPerBatch"],
-                    log_level="INFO",
+                    max_poll_interval=max_poll_interval,
                     model_filter=worker_config.get("modelFilter"),
                     operation_filter=worker_config.get("operationFilter"),
                     client_reference_filters=worker_config.get("clientReferenceFilters"),
                     stop_event=stop_event
                 )
                 
-                self.worker_instances[worker_id] = queue_worker
-                
                 # Create and start thread
                 thread = threading.Thread(
                     target=self._run_worker_thread,
-                    args=(worker_id, queue_worker),
+                    args=(worker_id, queue_worker, done),
                     daemon=True,
-                    name=f"Worker-{worker_identifier}"
+                    name=thread_name
                 )
                 
-                self.worker_threads[worker_id] = thread
+                self._register_worker(worker_id, _WorkerRecord(thread, stop_event, queue_worker, done))
                 
                 # Update worker status in DB
-                self.worker_service.update_worker(
-                    worker_id=worker_id,
-                    status=WorkerStatus.RUNNING,
+                self._set_status(
+                    worker_id,
+                    WorkerStatus.RUNNING,
                     thread_info={
                         "threadId": thread.ident,
-                        "startedAt": datetime.now().isoformat()
-                    },
-                    is_admin=True
+                        "startedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                    }
                 )
                 
                 # Start the thread
@@ -212,16 +431,11 @@ class WorkerManager:
                 return True
                 
             except Exception as e:
+                # Drop a record whose thread never started; stop_worker
+                # would otherwise try to join it
+                self._discard_worker(worker_id)
                 # Set status to error
-                try:
-                    self.worker_service.update_worker(
-                        worker_id=worker_id,
-                        status=WorkerStatus.ERROR,
-                        thread_info=None,
-                        is_admin=True
-                    )
-                except:
-                    pass
+                self._try_set_status(worker_id, WorkerStatus.ERROR)
                 # Re-raise to get more details in the API response
                 raise
     
@@ -235,221 +449,285 @@ class WorkerManager:
         Returns:
             True if worker stopped successfully, False otherwise
         """
-        with self.manager_lock:
+        with self._worker_lock(worker_id):
             # Check if worker is running
-            if worker_id not in self.worker_threads:
-                # Update DB status if it's marked as running
+            record = self._workers.get(worker_id)
+            if record is None:
+                # Update DB status if it's marked as running; nothing to
+                # check if this manager already marked it stopped
+                if self._last_known_status.get(worker_id) == _STATUS_STOPPED:
+                    return False
                 try:
                     worker = self.worker_service.get_worker_by_id(worker_id, is_admin=True)
-                    if worker.get("status") == WorkerStatus.RUNNING.value:
-                        self.worker_service.update_worker(
-                            worker_id=worker_id,
-                            status=WorkerStatus.STOPPED,
-                            thread_info=None,
-                            is_admin=True
-                        )
-                except:
-                    pass
+                    if worker.get("status") == _STATUS_RUNNING:
+                        self._set_status(worker_id, WorkerStatus.STOPPED)
+                except Exception as e:
+                    _warn_rate_limited("Failed to reconcile stopped worker", worker_id=worker_id, error=str(e))
                 return False
             
             try:
                 # Signal worker to stop
-                if worker_id in self.worker_stop_events:
-                    stop_event = self.worker_stop_events[worker_id]
-                    stop_event.set()
+                record.stop_event.set()
                 
                 # Wait for thread to finish (with timeout)
-                thread = self.worker_threads[worker_id]
-                thread.join(timeout=10)
+                record.thread.join(timeout=10)
                 
                 # Clean up
-                if worker_id in self.worker_threads:
-                    del self.worker_threads[worker_id]
-                if worker_id in self.worker_stop_events:
-                    del self.worker_stop_events[worker_id]
-                if worker_id in self.worker_instances:
-                    del self.worker_instances[worker_id]
+                self._discard_worker(worker_id)
                 
                 # Update worker status in DB
-                self.worker_service.update_worker(
-                    worker_id=worker_id,
-                    status=WorkerStatus.STOPPED,
-                    thread_info=None,
-                    is_admin=True
-                )
+                self._set_status(worker_id, WorkerStatus.STOPPED)
                 
                 return True
                 
             except Exception as e:
+                _warn_rate_limited("Failed to stop worker", worker_id=worker_id, error=str(e))
                 return False
     
-    def _run_worker_thread(self, worker_id: str, queue_worker: Any):
+    def _run_worker_thread(self, worker_id: str, queue_worker: Any, done: threading.Event):
         """
         Run the worker in a thread. Handles errors and updates status.
         
         Args:
             worker_id: Worker document ID
             queue_worker: QueueWorker instance
+            done: Event set once the thread has cleaned up
         """
         try:
             queue_worker.run_worker()
         except Exception as e:
-            print(f"⚠️  Worker {worker_id[:8]}... crashed: {str(e)}")
+            logger.exception("Worker crashed", worker_id=worker_id, error=str(e))
             # Update status to error
-            try:
-                self.worker_service.update_worker(
-                    worker_id=worker_id,
-                    status=WorkerStatus.ERROR,
-                    thread_info=None,
-                    is_admin=True
-                )
-            except:
-                pass
+            self._try_set_status(worker_id, WorkerStatus.ERROR)
         finally:
-            # Clean up
-            with self.manager_lock:
-                if worker_id in self.worker_threads:
-                    del self.worker_threads[worker_id]
-                if worker_id in self.worker_stop_events:
-                    del self.worker_stop_events[worker_id]
-                if worker_id in self.worker_instances:
-                    del self.worker_instances[worker_id]
+            # Clean up without taking the worker lock: stop_worker holds
+            # it while joining this thread
+            self._discard_worker(worker_id, threading.current_thread())
+            done.set()
+    
+    @staticmethod
+    def _effective_status(worker: Dict[str, Any], thread_running: bool) -> str:
+        """
+        Status to report for a worker given its live thread state.
+        
+        Args:
+            worker: Worker dictionary as stored
+            thread_running: Whether this process has a live thread for it
+            
+        Returns:
+            Stored status, corrected for a live or missing thread
+        """
+        if thread_running:
+            return _STATUS_RUNNING
+        if worker.get("status") == _STATUS_RUNNING:
+            return _STATUS_STOPPED
+        return worker.get("status")
     
     def get_worker_status(self, worker_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the current status of a worker (including thread status).
         
+        The stored status is corrected for the live thread state; the
+        watchdog persists such corrections.
+        
         Args:
             worker_id: Worker document ID
             
         Returns:
             Worker status dictionary or None if not found
         """
-        with self.manager_lock:
-            try:
+        # Read-only snapshot; no lock is held across DB calls
+        try:
+            worker = self._worker_cache.get(worker_id)
+            if worker is None:
                 worker = self.worker_service.get_worker_by_id(worker_id, is_admin=True)
-                
-                # Check if thread is actually running
-                thread_running = False
-                if worker_id in self.worker_threads:
-                    thread = self.worker_threads[worker_id]
-                    thread_running = thread.is_alive()
-                
-                # If DB says running but thread is not, update DB
-                if worker.get("status") == WorkerStatus.RUNNING.value and not thread_running:
-                    self.worker_service.update_worker(
-                        worker_id=worker_id,
-                        status=WorkerStatus.STOPPED,
-                        thread_info=None,
-                        is_admin=True
-                    )
-                    worker = self.worker_service.get_worker_by_id(worker_id, is_admin=True)
-                
-                return worker
-            except Exception as e:
-                return None
+                self._worker_cache.set(worker_id, worker)
+            
+            # Check if thread is actually running
+            record = self._workers.get(worker_id)
+            thread_running = record is not None and record.thread.is_alive()
+            
+            worker = dict(worker)
+            worker["status"] = self._effective_status(worker, thread_running)
+            return worker
+        except ValueError:
+            # Worker not found
+            return None
+        except Exception as e:
+            _warn_rate_limited("Failed to get worker status", worker_id=worker_id, error=str(e))
+            return None
     
     def list_workers(self) -> List[Dict[str, Any]]:
         """
         List all workers with their current status.
         
+        The stored status is corrected for the live thread state; the
+        watchdog persists such corrections.
+        
         Returns:
             List of worker dictionaries
         """
-        with self.manager_lock:
-            workers = self.worker_service.list_workers(is_admin=True)
-            
-            # Update status for each worker based on actual thread status
-            for worker in workers:
-                worker_id = worker["workerId"]
-                if worker_id in self.worker_threads:
-                    thread = self.worker_threads[worker_id]
-                    if thread.is_alive() and worker.get("status") != WorkerStatus.RUNNING.value:
-                        # Thread is running but DB says otherwise - update DB
-                        self.worker_service.update_worker(
-                            worker_id=worker_id,
-                            status=WorkerStatus.RUNNING,
-                            is_admin=True
-                        )
-                        worker = self.worker_service.get_worker_by_id(worker_id, is_admin=True)
-                    elif not thread.is_alive() and worker.get("status") == WorkerStatus.RUNNING.value:
-                        # Thread is not running but DB says running - update DB
-                        self.worker_service.update_worker(
-                            worker_id=worker_id,
-                            status=WorkerStatus.STOPPED,
-                            thread_info=None,
-                            is_admin=True
-                        )
-                        worker = self.worker_service.get_worker_by_id(worker_id, is_admin=True)
-            
-            return workers
+        # Snapshot thread liveness up front; no lock is held across DB calls
+        alive = self._snapshot_alive()
+        
+        workers = self.worker_service.list_workers(is_admin=True)
+        
+        result = []
+        for worker in workers:
+            worker = dict(worker)
+            worker["status"] = self._effective_status(worker, alive.get(worker["workerId"], False))
+            result.append(worker)
+        return result
+    
+    def _snapshot_alive(self) -> Dict[str, bool]:
+        """Thread liveness of every registered worker, taken without a lock"""
+        # A registered thread that has not started yet (ident is None) is
+        # mid-start_worker and already marked running
+        return {
+            worker_id: record.thread.ident is None or record.thread.is_alive()
+            for worker_id, record in self._workers.items()
+        }
+    
+    def _reconcile_all(self):
+        """
+        Persist status corrections for all workers in one pass.
+        
+        Workers whose stored status disagrees with their live thread state
+        are updated with at most one bulk write per target status. A worker
+        is skipped while a start/stop holds its lock, or when this manager
+        wrote its status after the documents were read. Workers whose
+        document is gone are forgotten.
+        """
+        known = dict(self._last_known_status)
+        tracked = set(known) | set(self._locks)
+        workers = self.worker_service.list_workers(is_admin=True)
+        # Snapshot liveness after the read so it is never older than the
+        # documents it is compared against
+        alive = self._snapshot_alive()
+        
+        # Workers tracked before the read but missing from it were deleted
+        gone = tracked - {worker["workerId"] for worker in workers}
+        for worker_id in gone:
+            lock = self._worker_lock(worker_id)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                if (
+                    worker_id not in self._workers
+                    and self._last_known_status.get(worker_id) == known.get(worker_id)
+                ):
+                    self._forget_locked(worker_id)
+            finally:
+                lock.release()
+        
+        stale: Dict[str, List[str]] = {_STATUS_RUNNING: [], _STATUS_STOPPED: []}
+        for worker in workers:
+            status = self._effective_status(worker, alive.get(worker["workerId"], False))
+            if status != worker.get("status"):
+                stale[status].append(worker["workerId"])
+        
+        # Shutdown stops threads without touching the DB so that running
+        # workers are restarted on the next boot; don't undo that
+        if self._watchdog_stop.is_set():
+            return
+        
+        for status in (WorkerStatus.RUNNING, WorkerStatus.STOPPED):
+            held: List[threading.Lock] = []
+            worker_ids = []
+            try:
+                for worker_id in stale[status.value]:
+                    # Never wait on a start/stop; it writes the status itself
+                    lock = self._worker_lock(worker_id)
+                    if not lock.acquire(blocking=False):
+                        continue
+                    held.append(lock)
+                    if self._last_known_status.get(worker_id) == known.get(worker_id):
+                        worker_ids.append(worker_id)
+                
+                if worker_ids:
+                    self.worker_service.bulk_update_status(worker_ids, status)
+                    for worker_id in worker_ids:
+                        self._last_known_status[worker_id] = status.value
+                        self._invalidate_cache(worker_id)
+            finally:
+                for lock in held:
+                    lock.release()
+    
+    def _start_watchdog(self):
+        """Start the background reconciliation thread if enabled and not running."""
+        interval = config.worker_watchdog_interval
+        if interval <= 0 or (self._watchdog_thread is not None and self._watchdog_thread.is_alive()):
+            return
+        self._watchdog_stop.clear()
+        self._watchdog_thread = threading.Thread(
+            target=self._watchdog,
+            args=(interval,),
+            daemon=True,
+            name="WorkerWatchdog"
+        )
+        self._watchdog_thread.start()
+    
+    def _watchdog(self, interval: float):
+        """
+        Periodically reconcile stored worker status with thread state.
+        
+        Args:
+            interval: Seconds between passes
+        """
+        while not self._watchdog_stop.wait(timeout=interval):
+            try:
+                self._reconcile_all()
+            except Exception as e:
+                _warn_rate_limited("Worker reconciliation failed", error=str(e))
     
     def stop_all_workers(self):
         """Stop all running workers. Called on shutdown."""
+        self._watchdog_stop.set()
+        
+        records = self._workers
+        
+        if not records:
+            return
+        
+        logger.info("Stopping workers", count=len(records))
+        
         # Suppress verbose logging during shutdown
-        import logging
-        old_level = logging.getLogger().level
-        logging.getLogger().setLevel(logging.ERROR)
+        with _suppressed_logging():
+            # Signal all workers to stop (parallel)
+            for record in records.values():
+                record.stop_event.set()
+            
+            # Wait for threads to finish (max 3 seconds total). Each record
+            # carries its own exit event, so a thread that exits before
+            # being waited on is still counted.
+            deadline = time.monotonic() + 3.0
+            stopped = 0
+            for record in records.values():
+                if record.done.wait(timeout=max(0.0, deadline - time.monotonic())):
+                    stopped += 1
+            
+            # Clean up all worker resources (don't update DB - it may be closed)
+            for worker_id, record in records.items():
+                self._discard_worker(worker_id, record.thread)
         
-        try:
-            with self.manager_lock:
-                worker_ids = list(self.worker_threads.keys())
-                
-                if not worker_ids:
-                    return
-                    
-                print(f"🛑 Stopping {len(worker_ids)} worker(s)...")
-                
-                # Signal all workers to stop (parallel)
-                for worker_id in worker_ids:
-                    try:
-                        if worker_id in self.worker_stop_events:
-                            stop_event = self.worker_stop_events[worker_id]
-                            stop_event.set()
-                    except Exception as e:
-                        pass
-                
-                # Wait for threads to finish (check every 0.3s, max 3 seconds total)
-                start_time = time.time()
-                max_wait = 3.0
-                check_interval = 0.3
-                
-                while time.time() - start_time < max_wait:
-                    # Check if all threads are done
-                    all_stopped = True
-                    for worker_id in worker_ids:
-                        if worker_id in self.worker_threads:
-                            thread = self.worker_threads[worker_id]
-                            if thread.is_alive():
-                                all_stopped = False
-                                break
-                    
-                    if all_stopped:
-                        break
-                    
-                    # Wait a bit before checking again
-                    time.sleep(check_interval)
-                
-                print(f"✅ All workers stopped")
-                
-                # Clean up all worker resources (don't update DB - it may be closed)
-                for worker_id in worker_ids:
-                    try:
-                        if worker_id in self.worker_threads:
-                            del self.worker_threads[worker_id]
-                        if worker_id in self.worker_stop_events:
-                            del self.worker_stop_events[worker_id]
-                        if worker_id in self.worker_instances:
-                            del self.worker_instances[worker_id]
-                    except Exception as e:
-                        pass
-        finally:
-            # Restore logging level
-            logging.getLogger().setLevel(old_level)
+        logger.info("Workers stopped", stopped=stopped, timed_out=len(records) - stopped)
+
+
+# Global manager instance
+_worker_manager: Optional[WorkerManager] = None
+_worker_manager_lock = threading.Lock()
 
 
-# Singleton instance getter
 def get_worker_manager() -> WorkerManager:
-    """Get the singleton WorkerManager instance"""
-    return WorkerManager()
+    """Get or create the singleton WorkerManager instance"""
+    global _worker_manager
+    manager = _worker_manager
+    if manager is None:
+        # Only the first call takes the lock; two managers would each
+        # own a separate set of worker threads
+        with _worker_manager_lock:
+            if _worker_manager is None:
+                _worker_manager = WorkerManager()
+            manager = _worker_manager
+    return manager
 
@@ -3,6 +3,10 @@ Worker management service layer
 Handles business logic for worker CRUD operations, validation, and access control
 """
 from typing import Optional, Dict, Any, List
+from datetime import datetime
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
 
 from config import config
 from utilities.cosmos_connector import (
@@ -10,20 +14,71 @@ from utilities.cosmos_connector import (
     db_create,
     db_read,
     db_find_one,
-    db_update,
-    db_delete,
     get_document_by_id,
+    new_document_metadata,
+    safe_insert_many,
+    safe_operation,
 )
 from api.core.logging import get_logger, BusinessLogger
 from api.models.worker_models import WorkerStatus, WorkerConfig
 
 logger = get_logger("api.services.worker_service")
 business_logger = BusinessLogger()
+_client_manager = ClientManager()
+
+# Keys of the stored worker config: exactly the WorkerConfig fields, which
+# is what WorkerConfig.model_dump() writes
+_CONFIG_KEYS = tuple(WorkerConfig.model_fields)
+
+# Fields read by WorkerService._format_worker_response (_id is implicit)
+_WORKER_PROJECTION = {
+    "clientId": 1,
+    "status": 1,
+    "config": 1,
+    "group": 1,
+    "threadInfo": 1,
+    "_metadata": 1
+}
+
+# Server-side equivalent of WorkerService._format_worker_response, used by
+# list reads so documents arrive already shaped for the API ($ifNull keeps
+# missing fields as null, matching dict.get)
+_WORKER_RESPONSE_PROJECTION = {
+    "_id": 0,
+    "workerId": {"$toString": "$_id"},
+    "clientId": {"$ifNull": ["$clientId", None]},
+    "status": {"$ifNull": ["$status", None]},
+    "config": {key: {"$ifNull": [f"$config.{key}", None]} for key in _CONFIG_KEYS},
+    "group": {"$ifNull": ["$group", None]},
+    "threadInfo": {"$ifNull": ["$threadInfo", None]},
+    "_metadata": {"$ifNull": ["$_metadata", {"$literal": {}}]}
+}
+
+# Summary key holding the worker IDs for each status
+_SUMMARY_ID_KEYS = {
+    status: f"{status}_ids"
+    for status in (WorkerStatus.RUNNING.value, WorkerStatus.STOPPED.value, WorkerStatus.ERROR.value)
+}
+
+
+def _parse_worker_id(worker_id: str) -> ObjectId:
+    """
+    Parse a worker document ID once at the service boundary.
+    
+    Raises:
+        ValueError: If worker_id is not a valid ObjectId
+    """
+    try:
+        return ObjectId(worker_id)
+    except (InvalidId, TypeError):
+        raise ValueError(f"Worker not found: {worker_id}")
 
 
 class WorkerService:
     """Service for managing workers with validation and access control"""
     
+    __slots__ = ("_connection_string", "db_name", "collection_name", "_cached_client")
+    
     def __init__(self):
         self._connection_string = config.db_connection_string
         self.db_name = config.db_name
@@ -33,11 +88,31 @@ class WorkerService:
     @property
     def mongo_client(self):
         """Get a valid MongoDB client, reusing cached client if available and not closed."""
-        client_manager = ClientManager()
-        self._cached_client = client_manager.get_valid_client(self._connection_string, self._cached_client)
+        self._cached_client = _client_manager.get_valid_client(self._connection_string, self._cached_client)
         return self._cached_client
     
-    def _check_worker_access(self, worker: Dict[str, Any], client_id: Optional[str], is_admin: bool = False) -> bool:
+    def ensure_indexes(self) -> None:
+        """
+        Create the indexes backing worker lookups, group listings and
+        summaries. Safe to call repeatedly; existing indexes are kept.
+        """
+        collection = self.mongo_client[self.db_name][self.collection_name]
+        try:
+            collection.create_index([("clientId", 1), ("workerId", 1)])
+            collection.create_index([("clientId", 1), ("group", 1)])
+            collection.create_index([("clientId", 1), ("status", 1)])
+            collection.create_index([
+                ("clientId", 1),
+                ("config.modelFilter", 1),
+                ("config.operationFilter", 1)
+            ])
+            collection.create_index([("_metadata.isDeleted", 1)])
+            logger.info("Worker indexes ensured")
+        except Exception as e:
+            logger.warning("Could not create worker indexes", error=str(e))
+    
+    @staticmethod
+    def _check_worker_access(worker: Dict[str, Any], client_id: Optional[str], is_admin: bool = False) -> bool:
         """
         Check if a client has access to a worker.
         
@@ -49,14 +124,7 @@ class WorkerService:
         Returns:
             True if access is allowed, False otherwise
         """
-        if is_admin:
-            return True
-        
-        if not client_id:
-            return False
-        
-        worker_client_id = worker.get("clientId")
-        return worker_client_id == client_id
+        return is_admin or (bool(client_id) and worker.get("clientId") == client_id)
     
     def create_worker(
         self,
@@ -87,7 +155,8 @@ class WorkerService:
             self.mongo_client,
             self.db_name,
             self.collection_name,
-            query={"workerId": worker_id, "clientId": client_id}
+            query={"workerId": worker_id, "clientId": client_id},
+            projection={"_id": 1}
         )
         if existing:
             raise ValueError(f"Worker ID '{worker_id}' already exists for this client")
@@ -97,13 +166,7 @@ class WorkerService:
             "workerId": worker_id,
             "clientId": client_id,
             "status": WorkerStatus.STOPPED.value,
-            "config": {
-                "pollInterval": config.pollInterval,
-                "maxItemsPerBatch": config.maxItemsPerBatch,
-                "modelFilter": config.modelFilter,
-                "operationFilter": config.operationFilter,
-                "clientReferenceFilters": config.clientReferenceFilters
-            },
+            "config": config.model_dump(),
             "group": group,
             "threadInfo": None
         }
@@ -122,8 +185,10 @@ class WorkerService:
 
         logger.info("Worker created successfully", worker_id=db_id, client_id=client_id, worker_identifier=worker_id, group=group)
 
-        # Return the created worker
-        return self.get_worker_by_id(db_id, client_id)
+        # Return the created worker from the inserted document; db_create
+        # has filled in _metadata and insert_one the _id
+        worker_doc["_id"] = ObjectId(db_id)
+        return self._format_worker_response(worker_doc)
     
     def list_workers(self, client_id: Optional[str] = None, is_admin: bool = False) -> List[Dict[str, Any]]:
         """
@@ -136,7 +201,10 @@ class WorkerService:
         Returns:
             List of worker dictionaries
         """
-        business_logger.log_operation("worker_service", "list_workers", client_id=client_id, is_admin=is_admin)
+        # Hot read path (polled by the worker manager and dashboards):
+        # skip building the log kwargs when business logging is disabled
+        if business_logger.is_enabled():
+            business_logger.log_operation("worker_service", "list_workers", client_id=client_id, is_admin=is_admin)
         
         # Build query
         if is_admin:
@@ -146,28 +214,9 @@ class WorkerService:
                 raise ValueError("Client ID is required for non-admin users")
             query = {"clientId": client_id}
         
-        workers = db_read(
-            self.mongo_client,
-            self.db_name,
-            self.collection_name,
-            query=query
-        )
-        
-        result = []
-        for worker in workers:
-            # Additional defensive check: ensure non-admin users only see their own workers
-            if not is_admin:
-                worker_client_id = worker.get("clientId")
-                if worker_client_id != client_id:
-                    logger.warning(
-                        "Worker returned with incorrect clientId, filtering out",
-                        worker_id=str(worker.get("_id")),
-                        expected_client_id=client_id,
-                        actual_client_id=worker_client_id
-                    )
-                    continue
-            
-            result.append(self._format_worker_response(worker))
+        # The clientId filter is applied server-side, so every returned
+        # worker already belongs to the requesting client
+        result = self._read_formatted_workers(query)
         
         logger.info("Listed workers", count=len(result), client_id=client_id, is_admin=is_admin)
         return result
@@ -187,13 +236,15 @@ class WorkerService:
         Raises:
             ValueError: If worker not found or access denied
         """
-        business_logger.log_operation("worker_service", "get_worker_by_id", worker_id=worker_id, client_id=client_id)
+        if business_logger.is_enabled():
+            business_logger.log_operation("worker_service", "get_worker_by_id", worker_id=worker_id, client_id=client_id)
         
         worker = get_document_by_id(
             self.mongo_client,
             self.db_name,
             self.collection_name,
-            worker_id
+            _parse_worker_id(worker_id),
+            projection=_WORKER_PROJECTION
         )
         
         if not worker:
@@ -233,33 +284,15 @@ class WorkerService:
         """
         business_logger.log_operation("worker_service", "update_worker", worker_id=worker_id, is_admin=is_admin)
         
-        # Get existing worker
-        worker = get_document_by_id(
-            self.mongo_client,
-            self.db_name,
-            self.collection_name,
-            worker_id
-        )
-        
-        if not worker:
-            raise ValueError(f"Worker not found: {worker_id}")
-        
-        # Check access (admin can update any, client can only update their own)
-        if not is_admin:
-            if not client_id or not self._check_worker_access(worker, client_id, is_admin=False):
-                raise ValueError("Access denied: worker not found or insufficient permissions")
+        # Check access up front (admin can update any, client can only update their own)
+        if not is_admin and not client_id:
+            raise ValueError("Access denied: worker not found or insufficient permissions")
         
         # Build update document
         updates = {}
         
         if config is not None:
-            updates["config"] = {
-                "pollInterval": config.pollInterval,
-                "maxItemsPerBatch": config.maxItemsPerBatch,
-                "modelFilter": config.modelFilter,
-                "operationFilter": config.operationFilter,
-                "clientReferenceFilters": config.clientReferenceFilters
-            }
+            updates["config"] = config.model_dump()
         
         if status is not None:
             updates["status"] = status.value
@@ -269,25 +302,136 @@ class WorkerService:
         
         if not updates:
             logger.warning("No updates provided", worker_id=worker_id)
-            return self._format_worker_response(worker)
+            return self.get_worker_by_id(worker_id, client_id, is_admin)
         
-        # Update the worker
-        success = db_update(
-            self.mongo_client,
-            self.db_name,
-            self.collection_name,
-            worker_id,
-            updates
-        )
+        oid = _parse_worker_id(worker_id)
         
-        if not success:
-            business_logger.log_error("worker_service", "update_worker", "Failed to update worker in database")
-            raise RuntimeError("Failed to update worker in database")
+        # Scope the filter to the client so the access check and the
+        # write happen in one round trip; soft-deleted workers are
+        # excluded as get_worker_by_id does
+        query = {"_id": oid, "_metadata.isDeleted": {"$ne": True}}
+        if not is_admin:
+            query["clientId"] = client_id
+        
+        updates["_metadata.updatedAt"] = datetime.now().isoformat()
+        collection = self.mongo_client[self.db_name][self.collection_name]
+        
+        def update_operation():
+            return collection.find_one_and_update(
+                query,
+                {"$set": updates},
+                projection=_WORKER_PROJECTION,
+                return_document=ReturnDocument.AFTER
+            )
+        
+        try:
+            worker = safe_operation(update_operation)
+        except Exception as e:
+            business_logger.log_error("worker_service", "update_worker", "Failed to update worker in database", error=str(e))
+            raise RuntimeError("Failed to update worker in database") from e
+        
+        if worker is None:
+            # Distinguish a missing worker from one owned by another client
+            if is_admin or not get_document_by_id(self.mongo_client, self.db_name, self.collection_name, oid, projection={"_id": 1}):
+                raise ValueError(f"Worker not found: {worker_id}")
+            raise ValueError("Access denied: worker not found or insufficient permissions")
         
         logger.info("Worker updated successfully", worker_id=worker_id)
         
-        # Return updated worker
-        return self.get_worker_by_id(worker_id, client_id, is_admin)
+        return self._format_worker_response(worker)
+    
+    def bulk_update_status(
+        self,
+        worker_ids: List[str],
+        status: WorkerStatus,
+        client_id: Optional[str] = None
+    ) -> int:
+        """
+        Set the status of many workers in a single round trip.
+        
+        Intended for internal reconciliation by the WorkerManager.
+        Soft-deleted workers are never touched, and passing client_id
+        restricts the write to that client's workers.
+        
+        Args:
+            worker_ids: Worker document IDs
+            status: New status for every listed worker
+            client_id: Optional client ID to scope the update to
+            
+        Returns:
+            Number of workers modified
+        """
+        object_ids = [ObjectId(worker_id) for worker_id in worker_ids if ObjectId.is_valid(worker_id)]
+        if not object_ids:
+            return 0
+        
+        business_logger.log_operation("worker_service", "bulk_update_status", count=len(object_ids), status=status.value)
+        
+        collection = self.mongo_client[self.db_name][self.collection_name]
+        
+        query = {
+            "_id": {"$in": object_ids},
+            "_metadata.isDeleted": {"$ne": True}
+        }
+        if client_id:
+            query["clientId"] = client_id
+        
+        def update_operation():
+            return collection.update_many(
+                query,
+                {"$set": {
+                    "status": status.value,
+                    "_metadata.updatedAt": datetime.now().isoformat()
+                }}
+            )
+        
+        result = safe_operation(update_operation)
+        skipped = len(object_ids) - result.matched_count
+        if skipped:
+            # Deleted (or other clients') workers are left untouched
+            logger.info("Worker status update skipped workers", skipped=skipped, status=status.value)
+        logger.info("Worker statuses updated", count=result.modified_count, status=status.value)
+        return result.modified_count
+    
+    def bulk_reset_running_to_stopped(self, worker_ids: List[str]) -> int:
+        """
+        Mark workers left running by a previous process as stopped.
+        
+        Only workers still marked running are touched, and their thread
+        information is cleared. Intended for WorkerManager startup, so no
+        access control is applied.
+        
+        Args:
+            worker_ids: Worker document IDs
+            
+        Returns:
+            Number of workers reset
+        """
+        object_ids = [ObjectId(worker_id) for worker_id in worker_ids if ObjectId.is_valid(worker_id)]
+        if not object_ids:
+            return 0
+        
+        business_logger.log_operation("worker_service", "bulk_reset_running_to_stopped", count=len(object_ids))
+        
+        collection = self.mongo_client[self.db_name][self.collection_name]
+        
+        def update_operation():
+            return collection.update_many(
+                {
+                    "_id": {"$in": object_ids},
+                    "status": WorkerStatus.RUNNING.value,
+                    "_metadata.isDeleted": {"$ne": True}
+                },
+                {"$set": {
+                    "status": WorkerStatus.STOPPED.value,
+                    "threadInfo": None,
+                    "_metadata.updatedAt": datetime.now().isoformat()
+                }}
+            )
+        
+        result = safe_operation(update_operation)
+        logger.info("Running workers reset to stopped", count=result.modified_count)
+        return result.modified_count
     
     def delete_worker(self, worker_id: str, client_id: Optional[str] = None, is_admin: bool = False) -> bool:
         """
@@ -306,41 +450,54 @@ class WorkerService:
         """
         business_logger.log_operation("worker_service", "delete_worker", worker_id=worker_id, client_id=client_id)
         
-        # Get existing worker
-        worker = get_document_by_id(
-            self.mongo_client,
-            self.db_name,
-            self.collection_name,
-            worker_id
-        )
+        if not is_admin and not client_id:
+            raise ValueError("Access denied: worker not found or insufficient permissions")
         
-        if not worker:
-            raise ValueError(f"Worker not found: {worker_id}")
+        oid = _parse_worker_id(worker_id)
         
-        # Check access
-        if not self._check_worker_access(worker, client_id, is_admin):
-            raise ValueError("Access denied: worker not found or insufficient permissions")
+        # Fold the access and running checks into the filter so the soft
+        # delete happens in one round trip (running workers must be
+        # stopped before deletion)
+        query = {
+            "_id": oid,
+            "status": {"$ne": WorkerStatus.RUNNING.value},
+            "_metadata.isDeleted": {"$ne": True}
+        }
+        if not is_admin:
+            query["clientId"] = client_id
         
-        # Check if worker is running (should be stopped before deletion)
-        current_status = worker.get("status")
-        if current_status == WorkerStatus.RUNNING.value:
-            raise ValueError("Cannot delete a running worker. Stop the worker first.")
+        now = datetime.now().isoformat()
+        collection = self.mongo_client[self.db_name][self.collection_name]
         
-        # Soft delete the worker
-        success = db_delete(
-            self.mongo_client,
-            self.db_name,
-            self.collection_name,
-            worker_id
-        )
+        def delete_operation():
+            return collection.find_one_and_update(
+                query,
+                {"$set": {
+                    "_metadata.isDeleted": True,
+                    "_metadata.deletedAt": now,
+                    "_metadata.updatedAt": now
+                }},
+                projection={"_id": 1}
+            )
         
-        if success:
-            logger.info("Worker deleted successfully", worker_id=worker_id)
-        else:
-            business_logger.log_error("worker_service", "delete_worker", "Failed to delete worker in database")
-            raise RuntimeError("Failed to delete worker in database")
+        try:
+            deleted = safe_operation(delete_operation)
+        except Exception as e:
+            business_logger.log_error("worker_service", "delete_worker", "Failed to delete worker in database", error=str(e))
+            raise RuntimeError("Failed to delete worker in database") from e
+        
+        if deleted is None:
+            # Work out which check failed
+            worker = get_document_by_id(self.mongo_client, self.db_name, self.collection_name, oid, projection={"clientId": 1})
+            if not worker:
+                raise ValueError(f"Worker not found: {worker_id}")
+            if not self._check_worker_access(worker, client_id, is_admin):
+                raise ValueError("Access denied: worker not found or insufficient permissions")
+            raise ValueError("Cannot delete a running worker. Stop the worker first.")
+        
+        logger.info("Worker deleted successfully", worker_id=worker_id)
         
-        return success
+        return True
     
     def get_workers_summary(
         self,
@@ -364,7 +521,8 @@ class WorkerService:
         Returns:
             Dictionary with counts by status, total count, and lists of IDs by status
         """
-        business_logger.log_operation("worker_service", "get_workers_summary", client_id=client_id, is_admin=is_admin)
+        if business_logger.is_enabled():
+            business_logger.log_operation("worker_service", "get_workers_summary", client_id=client_id, is_admin=is_admin)
         
         # Build query
         if is_admin:
@@ -390,10 +548,13 @@ class WorkerService:
         db = self.mongo_client[self.db_name]
         collection = db[self.collection_name]
         
-        # Build aggregation pipeline
+        # Exclude soft-deleted workers in the same $match
+        query["_metadata.isDeleted"] = {"$ne": True}
+
+        # Build aggregation pipeline; only _id and status reach $group
         pipeline = [
             {"$match": query},
-            {"$match": {"_metadata.isDeleted": {"$ne": True}}},  # Exclude soft-deleted
+            {"$project": {"status": 1}},
             {
                 "$group": {
                     "_id": "$status",
@@ -407,25 +568,20 @@ class WorkerService:
             results = list(collection.aggregate(pipeline))
             
             # Initialize summary with all statuses
-            summary = {
-                WorkerStatus.RUNNING.value: 0,
-                WorkerStatus.STOPPED.value: 0,
-                WorkerStatus.ERROR.value: 0,
-                "total": 0,
-                f"{WorkerStatus.RUNNING.value}_ids": [],
-                f"{WorkerStatus.STOPPED.value}_ids": [],
-                f"{WorkerStatus.ERROR.value}_ids": []
-            }
+            summary = dict.fromkeys(_SUMMARY_ID_KEYS, 0)
+            summary["total"] = 0
+            for ids_key in _SUMMARY_ID_KEYS.values():
+                summary[ids_key] = []
             
             # Populate counts and IDs from aggregation results
             for result in results:
                 status = result.get("_id")
-                count = result.get("count", 0)
-                worker_ids = result.get("worker_ids", [])
+                ids_key = _SUMMARY_ID_KEYS.get(status)
                 
-                if status in [WorkerStatus.RUNNING.value, WorkerStatus.STOPPED.value, WorkerStatus.ERROR.value]:
+                if ids_key is not None:
+                    count = result.get("count", 0)
                     summary[status] = count
-                    summary[f"{status}_ids"] = worker_ids
+                    summary[ids_key] = result.get("worker_ids", [])
                     summary["total"] += count
             
             logger.info("Workers summary retrieved", total=summary["total"], client_id=client_id, is_admin=is_admin)
@@ -451,18 +607,41 @@ class WorkerService:
             "workerId": str(worker["_id"]),
             "clientId": worker.get("clientId"),
             "status": worker.get("status"),
-            "config": {
-                "pollInterval": config_data.get("pollInterval"),
-                "maxItemsPerBatch": config_data.get("maxItemsPerBatch"),
-                "modelFilter": config_data.get("modelFilter"),
-                "operationFilter": config_data.get("operationFilter"),
-                "clientReferenceFilters": config_data.get("clientReferenceFilters")
-            },
+            "config": {key: config_data.get(key) for key in _CONFIG_KEYS},
             "group": worker.get("group"),
             "threadInfo": worker.get("threadInfo"),
             "_metadata": worker.get("_metadata", {})
         }
 
+    def _read_formatted_workers(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Read non-deleted workers matching a query, formatted server-side.
+
+        Args:
+            query: MongoDB filter (soft-deleted workers are always excluded)
+
+        Returns:
+            List of worker dictionaries in the _format_worker_response shape
+
+        Raises:
+            RuntimeError: If the database read fails
+        """
+        query["_metadata.isDeleted"] = {"$ne": True}
+        pipeline = [
+            {"$match": query},
+            {"$project": _WORKER_RESPONSE_PROJECTION}
+        ]
+        collection = self.mongo_client[self.db_name][self.collection_name]
+
+        def read_operation():
+            return list(collection.aggregate(pipeline))
+
+        try:
+            return safe_operation(read_operation)
+        except Exception as e:
+            logger.error("Error reading workers", error=str(e))
+            raise RuntimeError(f"Failed to read workers: {str(e)}")
+
     def get_workers_by_group(
         self,
         group: str,
@@ -489,16 +668,7 @@ class WorkerService:
                 raise ValueError("Client ID is required for non-admin users")
             query["clientId"] = client_id
 
-        workers = db_read(
-            self.mongo_client,
-            self.db_name,
-            self.collection_name,
-            query=query
-        )
-
-        result = []
-        for worker in workers:
-            result.append(self._format_worker_response(worker))
+        result = self._read_formatted_workers(query)
 
         logger.info("Listed workers by group", group=group, count=len(result), client_id=client_id)
         return result
@@ -529,30 +699,74 @@ class WorkerService:
             client_id=client_id, prefix=worker_id_prefix, count=count, group=group
         )
 
-        created = []
-        failed = []
+        worker_ids = [f"{worker_id_prefix}-{i}" for i in range(1, count + 1)]
+
+        # Check uniqueness for the whole batch in one query
+        existing = db_read(
+            self.mongo_client,
+            self.db_name,
+            self.collection_name,
+            query={"clientId": client_id, "workerId": {"$in": worker_ids}},
+            projection={"workerId": 1}
+        )
+        taken = {doc["workerId"] for doc in existing}
+
+        failed = [
+            {"workerId": worker_id, "error": f"Worker ID '{worker_id}' already exists for this client"}
+            for worker_id in worker_ids if worker_id in taken
+        ]
+
+        # Build every worker document up front; they share the config and
+        # the metadata db_create would otherwise fill in per insert
+        worker_config = config.model_dump()
+        metadata = new_document_metadata()
+        worker_docs = [
+            {
+                "workerId": worker_id,
+                "clientId": client_id,
+                "status": WorkerStatus.STOPPED.value,
+                "config": worker_config,
+                "group": group,
+                "threadInfo": None,
+                "_metadata": dict(metadata)
+            }
+            for worker_id in worker_ids if worker_id not in taken
+        ]
+
+        failed_indexes = set()
+        if worker_docs:
+            collection = self.mongo_client[self.db_name][self.collection_name]
 
-        for i in range(1, count + 1):
-            worker_id = f"{worker_id_prefix}-{i}"
             try:
-                worker = self.create_worker(
-                    client_id=client_id,
-                    worker_id=worker_id,
-                    config=config,
-                    group=group
-                )
-                created.append(worker)
+                # Throttled documents are retried; anything else, such as
+                # a duplicate, is reported per worker
+                write_errors = safe_insert_many(collection, worker_docs)
             except Exception as e:
+                business_logger.log_error("worker_service", "create_workers_batch", str(e))
+                raise RuntimeError(f"Failed to create workers in database: {str(e)}")
+
+            for write_error in write_errors:
+                index = write_error["index"]
+                failed_indexes.add(index)
+                worker_id = worker_docs[index]["workerId"]
                 logger.warning(
                     "Failed to create worker in batch",
                     worker_id=worker_id,
-                    error=str(e)
+                    error=write_error.get("errmsg")
                 )
                 failed.append({
                     "workerId": worker_id,
-                    "error": str(e)
+                    "error": write_error.get("errmsg", "Failed to create worker in database")
                 })
 
+        # insert_many sets _id on each document, so the responses are built
+        # from the inserted documents without reading them back
+        created = [
+            self._format_worker_response(worker_doc)
+            for index, worker_doc in enumerate(worker_docs)
+            if index not in failed_indexes
+        ]
+
         logger.info(
             "Batch worker creation completed",
             total_requested=count,
@@ -3,22 +3,33 @@
 Configuration Factory - Centralized configuration management
 """
 
+import functools
 import os
+import re
+import threading
 from typing import Optional
 from utilities.keyring_handler import get_secret
-from utilities.cosmos_connector import get_mongo_client, db_read
+from utilities.cosmos_connector import get_mongo_client, db_find_one
+from utilities.ttl_cache import TTLCache
 
 
+_MULTI_UNDERSCORE = re.compile(r"_+")
+
+# Seconds before a model whose key could not be loaded is looked up again
+_MODEL_KEY_MISS_TTL = 30.0
+
+
+@functools.lru_cache(maxsize=512)
 def _model_name_to_attr_name(name: str) -> str:
     """Convert model name to attribute name."""
     attr_name = (
         name.lower().replace("-", "_").replace(".", "_").replace(" ", "_")
     )
-    while "__" in attr_name:
-        attr_name = attr_name.replace("__", "_")
+    attr_name = _MULTI_UNDERSCORE.sub("_", attr_name)
     return f"{attr_name}_key"
 
 
+@functools.lru_cache(maxsize=512)
 def _key_to_env_var(key: str) -> str:
     """Convert kebab-case key reference to UPPER_SNAKE_CASE env var name."""
     return key.upper().replace("-", "_")
@@ -53,35 +64,12 @@ class ConfigFactory:
         except ValueError:
             raise ValueError("DB Connection String is required")
         
-        # LLM Keys (load keys based on DB models)
-        try:
-            mongo_client = get_mongo_client(self.db_connection_string)
-            models = db_read(mongo_client, self.db_name, "models")
-    
-            for model in models:
-                name = model.get("name")
-                key = model.get("key")
-                service = model.get("service")
-                sdk = model.get("sdk")
-        
-                # Skip loading keys for test SDK models
-                if sdk == "test":
-                    continue
-        
-                if name and key and service:
-                    attr_name = _model_name_to_attr_name(name)
-                    env_var_name = _key_to_env_var(key)
-                    try:
-                        setattr(
-                            self,
-                        attr_name,
-                        get_secret(env_var_name, service, name)
-                    )
-                    except Exception as e:
-                        print(f"Warning: Could not load key for model '{name}': {e}")
-        except Exception as e:
-            # Log error but don't fail initialization if models can't be loaded
-            print(f"Warning: Could not load models from database: {e}")     
+        # LLM keys are resolved lazily per model (see get_model_key)
+        self._model_keys = {}
+        self._model_keys_lock = threading.Lock()
+        self._model_key_misses = TTLCache(
+            maxsize=512, ttl=_MODEL_KEY_MISS_TTL
+        )
         
         # Client Key Pepper
         self.api_key_pepper = get_secret(
@@ -106,6 +94,22 @@ class ConfigFactory:
         self.poll_interval = int(os.getenv("POLL_INTERVAL", "10"))
         self.max_items_per_batch = int(os.getenv("MAX_ITEMS_PER_BATCH", "50"))
         self.num_llm_workers = int(os.getenv("NUM_LLM_WORKERS", "10"))
+        
+        # Read cache configuration (seconds, 0 disables caching)
+        self.stream_summary_cache_ttl = float(
+            os.getenv("STREAM_SUMMARY_CACHE_TTL", "3")
+        )
+        self.stream_list_cache_ttl = float(
+            os.getenv("STREAM_LIST_CACHE_TTL", "5")
+        )
+        self.worker_list_cache_ttl = float(
+            os.getenv("WORKER_LIST_CACHE_TTL", "1")
+        )
+        
+        # Seconds between worker status reconciliation passes (0 disables)
+        self.worker_watchdog_interval = float(
+            os.getenv("WORKER_WATCHDOG_INTERVAL", "30")
+        )
     
     @classmethod
     def reset(cls):
@@ -146,7 +150,9 @@ class ConfigFactory:
             key_ref: The key reference from the model document
                 (e.g. 'AZUREAIFOUNDRY_KEY').
             model_name: Optional model name, used as fallback
-                to look up the cached attribute from init.
+                to load the key from the keyring via the model
+                document (cached after the first successful load;
+                a failed load is retried after a short delay).
 
         Returns:
             The API key string or None if not found.
@@ -157,15 +163,55 @@ class ConfigFactory:
         if value:
             return value
 
-        # Fallback: try the cached attribute set during init
+        # Fallback: the key loaded from the keyring for this model,
+        # resolved on first use and cached
         if model_name:
             attr_name = _model_name_to_attr_name(model_name)
-            cached = getattr(self, attr_name, None)
+            cached = self._model_keys.get(attr_name)
             if cached:
                 return cached
+            if self._model_key_misses.get(attr_name):
+                return None
+            # Load without the lock so a slow DB or keyring call does
+            # not stall lookups for other models; if two threads load
+            # the same key, the first insert wins
+            loaded = self._load_model_key(model_name)
+            if not loaded:
+                self._model_key_misses.set(attr_name, True)
+                return None
+            with self._model_keys_lock:
+                return self._model_keys.setdefault(attr_name, loaded)
 
         return None
     
+    def _load_model_key(self, model_name: str) -> Optional[str]:
+        """Read a model's API key from the keyring via its DB document.
+
+        Args:
+            model_name: Name of the model document.
+
+        Returns:
+            The API key string or None if the model or key is missing.
+        """
+        try:
+            mongo_client = get_mongo_client(self.db_connection_string)
+            model = db_find_one(
+                mongo_client, self.db_name, "models", {"name": model_name}
+            )
+            if not model:
+                return None
+
+            key = model.get("key")
+            service = model.get("service")
+            # Test SDK models have no key to load
+            if model.get("sdk") == "test" or not (key and service):
+                return None
+
+            return get_secret(_key_to_env_var(key), service, model_name)
+        except Exception as e:
+            print(f"Warning: Could not load key for model '{model_name}': {e}")
+            return None
+    
     def __str__(self):
         """String representation for debugging"""
         return f"ConfigFactory(db_name={self.db_name})"
@@ -30,6 +30,7 @@ from utilities.json_repair import (
     repair_json_comprehensive,
     validate_json
 )
+from utilities.prompt_cache import cache_prompt, get_cached_prompt
 
 # Import centralized configuration
 from config import config
@@ -124,6 +125,7 @@ class QueueWorker:
         db_name: str = None,
         poll_interval: int = None,
         max_items_per_batch: int = None,
+        max_poll_interval: Optional[int] = None,
         exit_when_empty: bool = False,
         log_level: str = "INFO",
         model_filter: Optional[str] = None,
@@ -145,6 +147,10 @@ class QueueWorker:
                 not provided)
             max_items_per_batch: Maximum items to process per batch (uses
                 config if not provided)
+            max_poll_interval: Upper bound in seconds for the idle wait;
+                the wait doubles after each empty poll up to this value
+                and resets when items are found (no backoff if not
+                provided)
             exit_when_empty: Exit when no pending items found (for script
                 mode)
             log_level: Logging level (INFO or DEBUG)
@@ -170,6 +176,9 @@ class QueueWorker:
         self.max_items_per_batch = (
             max_items_per_batch or config.max_items_per_batch
         )
+        self.max_poll_interval = max(
+            max_poll_interval or self.poll_interval, self.poll_interval
+        )
         
         try:
             # Get connection string if not provided
@@ -228,8 +237,15 @@ class QueueWorker:
             db = self.mongo_client[self.db_name]
             collection = db["jobs"]
 
-            # Apply query and sort by priority (1 = ascending)
-            cursor = collection.find(query).sort("priority", 1).limit(limit)
+            # Apply query and sort by priority (1 = ascending). Match the
+            # batch size to the limit so the whole batch arrives in the
+            # first reply instead of 101 documents plus a getMore
+            cursor = (
+                collection.find(query)
+                .sort("priority", 1)
+                .limit(limit)
+                .batch_size(limit)
+            )
             items = list(cursor)
 
             return items
@@ -247,13 +263,21 @@ class QueueWorker:
         Returns:
             The prompt text content, or None if not found
         """
+        # Shared by all workers in the process (see utilities.prompt_cache)
+        cached = get_cached_prompt(prompt_id)
+        if cached is not None:
+            return cached
+
         try:
             prompt_doc = get_document_by_id(
-                self.mongo_client, self.db_name, "prompts", prompt_id
+                self.mongo_client, self.db_name, "prompts", prompt_id,
+                projection={"prompt": 1}
             )
             
             if prompt_doc:
-                return prompt_doc.get("prompt", "")
+                prompt = prompt_doc.get("prompt", "")
+                cache_prompt(prompt_id, prompt)
+                return prompt
             else:
                 print(f"⚠️ Prompt not found: {prompt_id}")
                 return None
@@ -924,6 +948,7 @@ class QueueWorker:
             print(f"🚀 Starting queue worker {self.worker_id}...")
             print(f"   Client ID: {self.client_id}")
             print(f"   Poll interval: {self.poll_interval}s")
+            print(f"   Max poll interval: {self.max_poll_interval}s")
             print(f"   Max items per batch: {self.max_items_per_batch}")
             model_filter_display = (
                 self.model_filter if self.model_filter else 'All models'
@@ -943,6 +968,9 @@ class QueueWorker:
             print(f"   Collection: jobs")
             print(f"   Exit when empty: {self.exit_when_empty}")
 
+        # Current idle wait; backs off towards max_poll_interval
+        idle_wait = self.poll_interval
+
         while not self.stop_event.is_set():
             try:
                 if self.log_level == "DEBUG":
@@ -964,13 +992,16 @@ class QueueWorker:
                         if self.log_level == "DEBUG":
                             print(
                                 f"📭 Worker {self.worker_id}: No pending "
-                                f"items found. Waiting {self.poll_interval}s..."
+                                f"items found. Waiting {idle_wait}s..."
                             )
                         # Use wait with timeout to allow checking stop_event
-                        if self.stop_event.wait(timeout=self.poll_interval):
+                        if self.stop_event.wait(timeout=idle_wait):
                             break
+                        idle_wait = min(idle_wait * 2, self.max_poll_interval)
                         continue
 
+                idle_wait = self.poll_interval
+
                 if self.log_level == "DEBUG":
                     print(
                         f"📋 Worker {self.worker_id}: Found "
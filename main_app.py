@@ -27,6 +27,8 @@ from api.routers import (
     runs
 )
 from api.services.worker_manager import get_worker_manager
+from api.services.stream_service import get_stream_service
+from api.services.worker_service import get_worker_service
 from llm_optimizers import get_run_orchestrator
 
 # Configure logging
@@ -44,6 +46,10 @@ async def lifespan(app: FastAPI):
         print("🚀 MetaSync API Starting...")
         print("="*60)
         
+        # Ensure indexes backing stream and worker queries
+        get_stream_service().ensure_indexes()
+        get_worker_service().ensure_indexes()
+        
         # Start worker manager
         manager = get_worker_manager()
         manager.load_workers_from_db()
@@ -6,6 +6,7 @@ This package provides shared utilities for:
 - LLM API integrations (llm_connector)
 - JSON repair and validation (json_repair)
 - Secure credential management (keyring_handler)
+- In-memory TTL caching (ttl_cache)
 
 Note: Imports are available but not eagerly loaded to avoid circular dependencies.
 Import directly from submodules as needed:
@@ -32,7 +33,9 @@ __all__ = [
     "repair_json_comprehensive",
     "validate_json",
     # Security
-    "get_secret"
+    "get_secret",
+    # Caching
+    "TTLCache",
 ]
 
 __version__ = "1.0.0"
@@ -80,5 +83,8 @@ def __getattr__(name):
     elif name == "get_secret":
         from utilities.keyring_handler import get_secret
         return get_secret
+    elif name == "TTLCache":
+        from utilities.ttl_cache import TTLCache
+        return TTLCache
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
@@ -1,6 +1,7 @@
 from pymongo import MongoClient
 from pymongo.collection import Collection
-from pymongo.errors import OperationFailure
+from pymongo.errors import BulkWriteError, OperationFailure
+import re
 import time
 from datetime import datetime
 import keyring
@@ -10,7 +11,7 @@ from pathlib import Path
 import warnings
 import socket
 import threading
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import urllib.parse
 
 from api.core.logging import get_logger, DatabaseLogger
@@ -22,6 +23,9 @@ warnings.filterwarnings("ignore", message=".*cosmosdb.*")
 
 db_logger = DatabaseLogger()
 
+# Cosmos reports the back-off for a throttled write inside its message
+_RETRY_AFTER_MS = re.compile(r"RetryAfterMs=(\d+)")
+
 
 class ClientManager:
     # Singleton class that manages MongoDB client instances by connection string.
@@ -131,6 +135,48 @@ def safe_operation(operation_func, retries=5):
     db_logger.log_error("database_operation", "unknown", "Too many retries for operation", retries=retries)
     raise RuntimeError("Too many retries for operation")
 
+def safe_insert_many(collection, documents: list, retries=5) -> List[dict]:
+    # Insert documents unordered, retrying the ones rejected for rate limiting.
+    # Throttled documents come back as per-document write errors (code 16500)
+    # rather than an OperationFailure, so safe_operation alone would never
+    # retry them. Returns the remaining write errors, each with "index"
+    # pointing into documents.
+    pending = list(range(len(documents)))
+    failures = []
+    for attempt in range(retries):
+        try:
+            safe_operation(
+                lambda: collection.insert_many(
+                    [documents[i] for i in pending], ordered=False
+                ),
+                retries=retries
+            )
+            return failures
+        except BulkWriteError as e:
+            throttled = []
+            wait_time = 0.0
+            for write_error in e.details.get("writeErrors", []):
+                write_error = dict(write_error)
+                write_error["index"] = pending[write_error["index"]]
+                if write_error.get("code") == 16500:  # Rate limited
+                    match = _RETRY_AFTER_MS.search(write_error.get("errmsg", ""))
+                    retry_after = int(match.group(1)) if match else 1000
+                    wait_time = max(wait_time, retry_after / 1000)
+                    throttled.append(write_error)
+                else:
+                    failures.append(write_error)
+            if not throttled:
+                return failures
+            pending = [write_error["index"] for write_error in throttled]
+            db_logger.log_error("database_operation", collection.name, f"Rate limited (429). Waiting {wait_time}s",
+                              attempt=attempt + 1, wait_time=wait_time, throttled=len(pending))
+            time.sleep(wait_time)
+    db_logger.log_error("database_operation", collection.name, "Too many retries for operation", retries=retries)
+    return failures + [
+        {"index": index, "code": 16500, "errmsg": "Too many retries for operation"}
+        for index in pending
+    ]
+
 def db_read(connection_string_or_client, db_name: str, collection_name: str, query: dict = None, limit: int = None, include_deleted: bool = False, projection: dict = None):
     # Read documents from a collection.
     # Can accept either connection string or already-initialized client
@@ -190,15 +236,38 @@ def db_find_one(connection_string_or_client, db_name: str, collection_name: str,
         print(f"Error finding document in collection '{collection_name}': {e}")
         return None
 
-def get_document_by_id(connection_string_or_client, db_name: str, collection_name: str, doc_id: str) -> Optional[dict]:
-    # Get a document by its _id.
+def get_document_by_id(connection_string_or_client, db_name: str, collection_name: str, doc_id: str, projection: dict = None) -> Optional[dict]:
+    # Get a document by its _id. doc_id may be a string or an already-parsed ObjectId.
     try:
         from bson import ObjectId
-        return db_find_one(connection_string_or_client, db_name, collection_name, {"_id": ObjectId(doc_id)})
+        return db_find_one(connection_string_or_client, db_name, collection_name, {"_id": ObjectId(doc_id)}, projection=projection)
     except Exception as e:
         print(f"Error getting document {doc_id} from {collection_name}: {e}")
         return None
 
+def new_document_metadata(user_name: str = None, user_id: str = None) -> dict:
+    # Standard _metadata block for a newly created document.
+    # Shared by db_create and callers that insert documents in bulk
+    metadata = {
+        "isDeleted": False,
+        "createdAt": datetime.now().isoformat(),
+        "deletedAt": None,
+        "updatedAt": None,
+        "archivedAt": None,
+        "createdBy": None,
+        "updatedBy": None,
+        "deletedBy": None
+    }
+    
+    # Track who created it if user info provided
+    if user_name and user_id:
+        metadata["createdBy"] = {
+            "userName": user_name,
+            "userId": user_id
+        }
+    
+    return metadata
+
 def db_create(connection_string_or_client, db_name: str, collection_name: str, document: dict, user_name: str = None, user_id: str = None):
     # Create a new document in the database.
     # Can accept either connection string or already-initialized client
@@ -216,21 +285,7 @@ def db_create(connection_string_or_client, db_name: str, collection_name: str, d
             document["_metadata"] = {}
         
         # Set up standard metadata fields
-        document["_metadata"]["isDeleted"] = False
-        document["_metadata"]["createdAt"] = datetime.now().isoformat()
-        document["_metadata"]["deletedAt"] = None
-        document["_metadata"]["updatedAt"] = None
-        document["_metadata"]["archivedAt"] = None
-        document["_metadata"]["createdBy"] = None
-        document["_metadata"]["updatedBy"] = None
-        document["_metadata"]["deletedBy"] = None
-        
-        # Track who created it if user info provided
-        if user_name and user_id:
-            document["_metadata"]["createdBy"] = {
-                "userName": user_name,
-                "userId": user_id
-            }
+        document["_metadata"].update(new_document_metadata(user_name, user_id))
         
         def create_operation():
             result = collection.insert_one(document)
@@ -0,0 +1,28 @@
+"""
+Process-wide cache of prompt text by prompt ID.
+
+Queue workers read through it when building jobs, and the prompt
+service drops entries when a prompt is updated or deleted. Workers
+running in another process see such changes within the TTL.
+"""
+from typing import Optional
+
+from utilities.ttl_cache import TTLCache
+
+# Jobs reuse a handful of prompts, so this saves a read per job
+_prompt_cache = TTLCache(maxsize=512, ttl=60)
+
+
+def get_cached_prompt(prompt_id: str) -> Optional[str]:
+    """Return the cached text for prompt_id, or None if absent/expired."""
+    return _prompt_cache.get(str(prompt_id))
+
+
+def cache_prompt(prompt_id: str, prompt: str) -> None:
+    """Store the text of prompt_id."""
+    _prompt_cache.set(str(prompt_id), prompt)
+
+
+def invalidate_prompt(prompt_id: str) -> None:
+    """Drop the cached text of prompt_id so the next read fetches it."""
+    _prompt_cache.pop(str(prompt_id))
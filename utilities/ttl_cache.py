@@ -0,0 +1,93 @@
+"""
+Small thread-safe in-memory cache with per-entry expiry.
+
+Used by services to absorb repeated identical reads (dashboards
+polling summaries, model lookups) without adding a third-party
+dependency.
+"""
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire ``ttl`` seconds after insert.
+
+    Expired entries are dropped lazily on read, and swept on insert
+    when the cache reaches ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if absent/expired."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            with self._lock:
+                if self._data.get(key) is entry:
+                    del self._data[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key for ``ttl`` seconds."""
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict(now)
+            self._data[key] = (now + self.ttl, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (expired or not)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self, now: float) -> None:
+        # Caller holds the lock. Drop expired entries first; if the
+        # cache is still full, drop the oldest insertions.
+        expired = [k for k, (exp, _) in self._data.items() if exp <= now]
+        for key in expired:
+            del self._data[key]
+        overflow = len(self._data) - self.maxsize + 1
+        if overflow > 0:
+            for key in list(self._data)[:overflow]:
+                del self._data[key]
+
+
+def make_cache_key(*parts: Any) -> Optional[Tuple[Any, ...]]:
+    """
+    Build a hashable cache key from query parameters.
+
+    Dict parts are converted to sorted item tuples. Returns None if a
+    part cannot be hashed, so callers can skip caching for that query.
+    """
+    key = []
+    for part in parts:
+        if isinstance(part, dict):
+            part = tuple(sorted(part.items()))
+        key.append(part)
+    key = tuple(key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key